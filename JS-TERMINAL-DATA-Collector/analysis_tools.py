@@ -14,25 +14,211 @@ Usage:
 import json
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import os
+import zipfile
 import argparse
 import hashlib
 import time
 from datetime import datetime, timedelta
 from scipy import stats
+from scipy.special import chdtrc
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report, confusion_matrix
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+try:
+    from numba import njit, prange, get_num_threads
+except ImportError:  # numba is optional; the numpy path below is used instead
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; without it columns are cached as .npz
+    pa = pq = None
+
+
+def _sequence_windows_numpy(peaks, ticks, rug, durations, sequence_length):
+    """Build the sliding-window feature matrix and next-game targets with numpy"""
+    # Features: previous N games, as [peak, ticks, instarug, duration] per game.
+    # The last window has no following game to predict, so it is dropped.
+    windows = [sliding_window_view(col, sequence_length)[:-1]
+               for col in (peaks, ticks, rug, durations)]
+    
+    # Target: is next game an instarug?
+    y = rug[sequence_length:]
+    
+    return np.stack(windows, axis=-1).reshape(len(y), -1), y
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _sequence_windows(peaks, ticks, rug, durations, sequence_length):
+        """Numba version of _sequence_windows_numpy, filling X and y in parallel"""
+        n_samples = len(peaks) - sequence_length
+        X = np.empty((n_samples, sequence_length * 4), dtype=np.float32)
+        y = np.empty(n_samples, dtype=np.int8)
+        
+        for i in prange(n_samples):
+            for j in range(sequence_length):
+                game_idx = i + j
+                X[i, 4 * j] = peaks[game_idx]
+                X[i, 4 * j + 1] = ticks[game_idx]
+                X[i, 4 * j + 2] = rug[game_idx]
+                X[i, 4 * j + 3] = durations[game_idx]
+            y[i] = rug[i + sequence_length]
+        
+        return X, y
+else:
+    _sequence_windows = _sequence_windows_numpy
+
+
+def _basic_stats_numpy(peaks, rug, durations, ticks, events, peak_ids, n_bins):
+    """
+    Totals used by analyze_basic_patterns: (instarugs, non-NaN peak count,
+    peak sum, peak max, duration sum, tick sum, event sum, per-bin peak
+    counts). NaN peaks are skipped, as pandas' mean() and max() do.
+    """
+    bins = np.bincount(peak_ids[peak_ids >= 0], minlength=n_bins)
+    known_peaks = peaks[~np.isnan(peaks)]
+    peak_max = known_peaks.max() if len(known_peaks) else np.nan
+    return (int(rug.sum()), len(known_peaks), known_peaks.sum(dtype=np.float64), peak_max,
+            durations.sum(dtype=np.float64), ticks.sum(dtype=np.float64),
+            events.sum(dtype=np.float64), bins)
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _basic_stats(peaks, rug, durations, ticks, events, peak_ids, n_bins):
+        """Numba version of _basic_stats_numpy: one fused pass, split into per-thread chunks"""
+        n = len(peaks)
+        n_chunks = get_num_threads()
+        sums = np.zeros((n_chunks, 5))
+        peak_counts = np.zeros(n_chunks, dtype=np.int64)
+        peak_max = np.full(n_chunks, -np.inf)
+        bins = np.zeros((n_chunks, n_bins), dtype=np.int64)
+        
+        for c in prange(n_chunks):
+            for i in range(c * n // n_chunks, (c + 1) * n // n_chunks):
+                sums[c, 0] += rug[i]
+                if not np.isnan(peaks[i]):
+                    peak_counts[c] += 1
+                    sums[c, 1] += peaks[i]
+                    peak_max[c] = max(peak_max[c], peaks[i])
+                sums[c, 2] += durations[i]
+                sums[c, 3] += ticks[i]
+                sums[c, 4] += events[i]
+                if peak_ids[i] >= 0:
+                    bins[c, peak_ids[i]] += 1
+        
+        totals = sums.sum(axis=0)
+        n_peaks = peak_counts.sum()
+        return (int(totals[0]), n_peaks, totals[1], peak_max.max() if n_peaks else np.nan,
+                totals[2], totals[3], totals[4], bins.sum(axis=0))
+else:
+    _basic_stats = _basic_stats_numpy
+
+
+def _parse_byte_range(analyzer_cls, path, start, end):
+    """Worker process entry point: flatten the games in one byte range of a JSONL file"""
+    analyzer = analyzer_cls()
+    return analyzer._extract_columns(analyzer._iter_games(path, start, end))
+
+
 class RugsDataAnalyzer:
+    # Rows per column-array batch when streaming the master JSONL file
+    BATCH_SIZE = 50_000
+    
+    # Minimum bytes of JSONL per worker process before parsing goes parallel
+    PARALLEL_CHUNK_BYTES = 64 * 1024 * 1024
+    
+    # Flattened per-game columns (one array each) and their storage dtypes.
+    # 32-bit numerics halve the bytes scanned by the stats and ML paths, and
+    # ISO timestamps are parsed by numpy as they are stored (as naive UTC).
+    COLUMN_DTYPES = {
+        'game_number': np.int32,
+        'game_id': object,
+        'recording_start': 'datetime64[ms]',
+        'recording_end': 'datetime64[ms]',
+        'duration_seconds': np.int32,
+        'peak_multiplier': np.float32,
+        'final_tick': np.int32,
+        'is_instarug': bool,
+        'total_trades': np.int32,
+        'unique_players': np.int32,
+        'total_events': np.int32,
+        'game_state_updates': np.int32,
+        'price_min': np.float32,
+        'price_max': np.float32,
+        'collection_version': object,
+        'hourly_game_number': np.int32,
+        'completion_reason': object,
+    }
+    
+    # Where each column comes from in the raw game JSON: (parent object, key, default).
+    # None means the game's 1-based position in the stream.
+    COLUMN_SOURCES = {
+        # Basic identifiers
+        'game_number': None,
+        'game_id': ('game', 'gameId', ''),
+        'recording_start': ('game', 'recordingStart', ''),
+        'recording_end': ('game', 'recordingEnd', ''),
+        'duration_seconds': ('game', 'duration', 0),
+        
+        # Game outcome metrics
+        'peak_multiplier': ('analysis', 'peakMultiplier', 0),
+        'final_tick': ('analysis', 'finalTick', 0),
+        'is_instarug': ('analysis', 'isInstarug', False),
+        'total_trades': ('analysis', 'totalTrades', 0),
+        'unique_players': ('analysis', 'uniquePlayers', 0),
+        
+        # Event metrics
+        'total_events': ('game', 'totalEvents', 0),
+        'game_state_updates': ('analysis', 'gameStateUpdates', 0),
+        
+        # Price metrics
+        'price_min': ('price_range', 'min', 0),
+        'price_max': ('price_range', 'max', 0),
+        
+        # Collection metadata
+        'collection_version': ('metadata', 'collectorVersion', ''),
+        'hourly_game_number': ('metadata', 'hourlyGameNumber', 0),
+        
+        # Completion reason
+        'completion_reason': ('game', 'reason', 'UNKNOWN'),
+    }
+    
+    # Low-cardinality string columns stored as pandas categoricals
+    CATEGORICAL_COLUMNS = ('collection_version', 'completion_reason')
+    
+    # Peak multiplier ranges, right-closed: (0, 2], (2, 5], ... (50, inf]
+    PEAK_BINS = np.array([0, 2, 5, 10, 20, 50, np.inf])
+    PEAK_LABELS = ['0-2x', '2-5x', '5-10x', '10-20x', '20-50x', '50x+']
+    
     def __init__(self, data_dir="rugs-data"):
         self.data_dir = Path(data_dir)
+        self.cache_dir = self.data_dir / ".cache"
         self.games_df = None
-        self.raw_games = []
+        self._extract_game = self._compile_extractor()
         
     def load_collected_data(self):
         """Load all collected game data from JSONL files"""
@@ -44,90 +230,300 @@ class RugsDataAnalyzer:
         if not master_file.exists():
             print(f"❌ Master data file not found: {master_file}")
             return False
-            
-        games = []
-        with open(master_file, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                try:
-                    game = json.loads(line.strip())
-                    games.append(game)
-                except json.JSONDecodeError as e:
-                    print(f"⚠️  Error parsing line {line_num}: {e}")
-                    continue
         
-        self.raw_games = games
-        print(f"✅ Loaded {len(games)} games from master file")
-        
-        # Convert to DataFrame for analysis
-        self.games_df = self.create_analysis_dataframe(games)
+        # Columnar cache of every line up to a stored byte offset; only games
+        # appended to the master file since then are parsed
+        columns, offset = self._read_cache(master_file)
+        size = master_file.stat().st_size
+        new_offset = self._complete_lines_end(master_file, size)
+        if offset < new_offset:
+            new_columns = self._parse_jsonl(master_file, start=offset, end=new_offset)
+            columns = self._concat_columns([columns, new_columns])
+            print(f"🔄 Caching {len(new_columns['game_number'])} new games in {self.cache_dir}")
+            self._write_cache(columns, master_file, new_offset)
+        
+        # A final line without its newline yet is loaded but never cached,
+        # so it is read again (complete or not) on the next load
+        if new_offset < size:
+            tail_columns = self._parse_jsonl(master_file, start=new_offset, end=size)
+            columns = self._concat_columns([columns, tail_columns])
+        
+        self.games_df = self._frame_from_columns(columns)
+        print(f"✅ Loaded {len(self.games_df)} games from master file")
         print(f"📈 Created analysis DataFrame: {self.games_df.shape}")
         
         return True
     
-    def create_analysis_dataframe(self, games):
-        """Convert raw game data to pandas DataFrame for analysis"""
-        analysis_data = []
+    def _iter_games(self, path, start=0, end=None):
+        """
+        Yield decoded games one at a time from a JSONL file.
+        
+        With a byte range, only lines that start in [start, end) are decoded, so
+        adjacent ranges split a file without losing or repeating a line.
+        """
+        with open(path, 'rb') as f:
+            if start:
+                # Skip the rest of the line that straddles the range start
+                f.seek(start - 1)
+                f.readline()
+            pos = f.tell()
+            
+            for line_num, line in enumerate(f, 1):
+                if end is not None and pos >= end:
+                    break
+                line_start, pos = pos, pos + len(line)
+                if not line.strip():
+                    continue
+                try:
+                    yield _json_loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    location = f"line {line_num}" if not start else f"byte offset {line_start}"
+                    print(f"⚠️  Error parsing {location}: {e}")
+                    continue
+    
+    def _parse_jsonl(self, path, start=0, end=None):
+        """
+        Flatten the lines of a JSONL file that start in [start, end) into
+        column arrays, splitting large ranges across processes
+        """
+        if end is None:
+            end = path.stat().st_size
+        workers = min(os.cpu_count() or 1, (end - start) // self.PARALLEL_CHUNK_BYTES)
+        
+        if workers <= 1:
+            # Stream games straight into the column arrays (no raw dict retention)
+            return self._extract_columns(self._iter_games(path, start, end))
+        
+        bounds = np.linspace(start, end, workers + 1).astype(np.int64).tolist()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_parse_byte_range, repeat(type(self)), repeat(path),
+                                   bounds[:-1], bounds[1:]))
+        
+        return self._concat_columns(chunks)
+    
+    def _concat_columns(self, chunks):
+        """Concatenate column arrays in order, renumbering each chunk's games after the last"""
+        offset = 0
+        for chunk in chunks:
+            chunk['game_number'] = chunk['game_number'] + offset
+            offset += len(chunk['game_number'])
+        
+        return {name: np.concatenate([chunk[name] for chunk in chunks])
+                for name in self.COLUMN_DTYPES}
+    
+    def _complete_lines_end(self, path, size):
+        """Byte offset just past the last newline, so a half-written final line is re-read later"""
+        with open(path, 'rb') as f:
+            end = size
+            while end > 0:
+                start = max(end - 65536, 0)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b'\n')
+                if newline >= 0:
+                    return start + newline + 1
+                end = start
+        return 0
+    
+    def _tail_digest(self, path, offset):
+        """Digest of the bytes just before offset, to detect a rewritten (not appended) file"""
+        with open(path, 'rb') as f:
+            f.seek(max(offset - 4096, 0))
+            return hashlib.sha1(f.read(min(offset, 4096))).hexdigest()
+    
+    def _arrow_schema(self):
+        """Arrow schema matching COLUMN_DTYPES (string columns as Arrow strings)"""
+        return pa.schema([
+            (name, pa.string() if dtype is object else pa.from_numpy_dtype(np.dtype(dtype)))
+            for name, dtype in self.COLUMN_DTYPES.items()
+        ])
+    
+    def _cache_layout(self):
+        """Cache format and column dtypes; a cache written with any other layout is discarded"""
+        return {
+            'format': 'parquet' if pq is not None else 'npz',
+            'columns': {name: str(np.dtype(dtype)) for name, dtype in self.COLUMN_DTYPES.items()},
+        }
+    
+    def _read_cache(self, master_file):
+        """
+        Cached column arrays and the JSONL byte offset they cover, or empty
+        columns and offset 0 if the cache is missing or no longer a prefix of the file
+        """
+        state_file = self.cache_dir / "state.json"
+        empty = (self._alloc_columns(0), 0)
+        if not state_file.exists():
+            return empty
+        
+        # A state file or columns file left by an older layout or an interrupted
+        # write counts as a cache miss, not an error
+        try:
+            state = _json_loads(state_file.read_bytes())
+            offset = state['jsonl_offset']
+            if (state['layout'] != self._cache_layout()
+                    or master_file.stat().st_size < offset
+                    or state['tail_sha1'] != self._tail_digest(master_file, offset)):
+                return empty
+            
+            if state['layout']['format'] == 'parquet':
+                columns = self._read_parquet(self.cache_dir / "columns.parquet")
+            else:
+                with np.load(self.cache_dir / "columns.npz") as data:
+                    columns = {name: data[name].astype(object) if dtype is object else data[name]
+                               for name, dtype in self.COLUMN_DTYPES.items()}
+            
+            if len(columns['game_number']) != state['rows']:
+                return empty
+        except (KeyError, TypeError, ValueError, OSError, EOFError, zipfile.BadZipFile):
+            return empty
+        return columns, offset
+    
+    def _write_cache(self, columns, master_file, offset):
+        """Write column arrays covering master_file[:offset] and their state to the cache directory"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        state_file = self.cache_dir / "state.json"
+        state_file.unlink(missing_ok=True)
+        
+        layout = self._cache_layout()
+        if layout['format'] == 'parquet':
+            self._write_parquet(columns, self.cache_dir / "columns.parquet")
+        else:
+            # String columns are stored as fixed-width unicode so no pickling is needed
+            npz_file = self.cache_dir / "columns.npz"
+            tmp_file = npz_file.with_suffix('.npz.tmp')
+            with open(tmp_file, 'wb') as f:
+                np.savez(f, **{name: columns[name].astype(str) if dtype is object else columns[name]
+                               for name, dtype in self.COLUMN_DTYPES.items()})
+            os.replace(tmp_file, npz_file)
+        
+        # Written last, and only once complete, so a partially written cache is never considered valid
+        tmp_file = state_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(_json_dumps({
+            'layout': layout,
+            'jsonl_offset': offset,
+            'rows': len(columns['game_number']),
+            'tail_sha1': self._tail_digest(master_file, offset),
+        }))
+        os.replace(tmp_file, state_file)
+    
+    def _write_parquet(self, columns, parquet_file):
+        """Write column arrays to the Parquet cache in BATCH_SIZE row groups"""
+        schema = self._arrow_schema()
+        table = pa.table([pa.array(columns[field.name], type=field.type) for field in schema],
+                         schema=schema)
+        
+        # Only replace the cache once it is complete
+        tmp_file = parquet_file.with_suffix('.parquet.tmp')
+        pq.write_table(table, tmp_file, row_group_size=self.BATCH_SIZE, compression='snappy')
+        os.replace(tmp_file, parquet_file)
+    
+    def _read_parquet(self, parquet_file):
+        """Read the Parquet cache back into one numpy array per column"""
+        table = pq.read_table(parquet_file, columns=list(self.COLUMN_DTYPES))
+        return {name: table.column(name).to_numpy() for name in self.COLUMN_DTYPES}
+    
+    def _alloc_columns(self, size):
+        """Allocate one empty array per output column"""
+        return {name: np.empty(size, dtype=dtype) for name, dtype in self.COLUMN_DTYPES.items()}
+    
+    def _compile_extractor(self):
+        """
+        Generate a per-game flattening function specialized to COLUMN_SOURCES.
+        
+        The generated function takes the output arrays as arguments, so the hot
+        loop does plain local stores instead of a dict lookup per column.
+        """
+        names = list(self.COLUMN_DTYPES)
+        lines = [
+            f"def _extract_game(game, n, number, {', '.join(names)}):",
+            "    analysis = game.get('analysis') or {}",
+            "    price_range = analysis.get('priceRange') or {}",
+            "    metadata = game.get('collectionMetadata') or {}",
+        ]
+        for name in names:
+            source = self.COLUMN_SOURCES[name]
+            if source is None:
+                lines.append(f"    {name}[n] = number")
+                continue
+            parent, key, default = source
+            dtype = np.dtype(self.COLUMN_DTYPES[name])
+            if np.issubdtype(dtype, np.floating):
+                # JSON null (e.g. an untouched +/-Infinity price range) becomes NaN
+                lines.append(f"    value = {parent}.get({key!r}, {default!r})")
+                lines.append(f"    {name}[n] = nan if value is None else value")
+            elif np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.bool_):
+                # Integer and bool arrays have no missing value, so JSON null
+                # is stored as the column's default
+                lines.append(f"    value = {parent}.get({key!r}, {default!r})")
+                lines.append(f"    {name}[n] = {default!r} if value is None else value")
+            else:
+                lines.append(f"    {name}[n] = {parent}.get({key!r}, {default!r})")
+        
+        namespace = {'nan': np.nan}
+        exec(compile('\n'.join(lines), '<game-extractor>', 'exec'), namespace)
+        return namespace['_extract_game']
+    
+    def _iter_column_batches(self, games):
+        """Flatten games into column arrays, yielding a dict of arrays per BATCH_SIZE games"""
+        extract_game = self._extract_game
+        cols = self._alloc_columns(self.BATCH_SIZE)
+        arrays = tuple(cols.values())
+        n = 0
         
         for i, game in enumerate(games):
             try:
-                # Extract key metrics for analysis
-                analysis = game.get('analysis', {})
-                
-                game_data = {
-                    # Basic identifiers
-                    'game_number': i + 1,
-                    'game_id': game.get('gameId', ''),
-                    'recording_start': game.get('recordingStart', ''),
-                    'recording_end': game.get('recordingEnd', ''),
-                    'duration_seconds': game.get('duration', 0),
-                    
-                    # Game outcome metrics
-                    'peak_multiplier': analysis.get('peakMultiplier', 0),
-                    'final_tick': analysis.get('finalTick', 0),
-                    'is_instarug': analysis.get('isInstarug', False),
-                    'total_trades': analysis.get('totalTrades', 0),
-                    'unique_players': analysis.get('uniquePlayers', 0),
-                    
-                    # Event metrics
-                    'total_events': game.get('totalEvents', 0),
-                    'game_state_updates': analysis.get('gameStateUpdates', 0),
-                    
-                    # Price metrics
-                    'price_min': analysis.get('priceRange', {}).get('min', 0),
-                    'price_max': analysis.get('priceRange', {}).get('max', 0),
-                    
-                    # Collection metadata
-                    'collection_version': game.get('collectionMetadata', {}).get('collectorVersion', ''),
-                    'hourly_game_number': game.get('collectionMetadata', {}).get('hourlyGameNumber', 0),
-                    
-                    # Timing data (if available)
-                    'rug_event_timing': game.get('rugEventTiming', {}),
-                    
-                    # Completion reason
-                    'completion_reason': game.get('reason', 'UNKNOWN')
-                }
-                
-                analysis_data.append(game_data)
-                
+                extract_game(game, n, i + 1, *arrays)
             except Exception as e:
                 print(f"⚠️  Error processing game {i}: {e}")
                 continue
-        
-        df = pd.DataFrame(analysis_data)
-        
-        # Convert timestamps
-        df['recording_start'] = pd.to_datetime(df['recording_start'])
-        df['recording_end'] = pd.to_datetime(df['recording_end'])
-        
-        # Create derived features
-        df['hour'] = df['recording_start'].dt.hour
-        df['day_of_week'] = df['recording_start'].dt.dayofweek
-        df['peak_category'] = pd.cut(df['peak_multiplier'], 
-                                   bins=[0, 2, 5, 10, 20, 50, np.inf],
-                                   labels=['0-2x', '2-5x', '5-10x', '10-20x', '20-50x', '50x+'])
+            
+            n += 1
+            if n == self.BATCH_SIZE:
+                yield cols
+                cols = self._alloc_columns(self.BATCH_SIZE)
+                arrays = tuple(cols.values())
+                n = 0
+        
+        if n:
+            yield {name: col[:n] for name, col in cols.items()}
+    
+    def _extract_columns(self, games):
+        """Flatten games into a single dict of column arrays"""
+        chunks = list(self._iter_column_batches(games)) or [self._alloc_columns(0)]
+        return {name: np.concatenate([chunk[name] for chunk in chunks])
+                for name in self.COLUMN_DTYPES}
+    
+    def _frame_from_columns(self, columns):
+        """Build the analysis DataFrame (with derived features) from column arrays"""
+        df = pd.DataFrame(columns)
+        for name in self.CATEGORICAL_COLUMNS:
+            df[name] = pd.Categorical(df[name])
+        if pa is not None:
+            # Remaining string columns (high-cardinality ids) as Arrow strings
+            # rather than Python objects; nunique etc. then run in Arrow kernels
+            for name, dtype in self.COLUMN_DTYPES.items():
+                if dtype is object and name not in self.CATEGORICAL_COLUMNS:
+                    df[name] = pd.array(columns[name], dtype=pd.ArrowDtype(pa.string()))
+        
+        # Create derived features with integer datetime arithmetic
+        # (1970-01-01 was a Thursday, i.e. dayofweek 3 with Monday = 0);
+        # -1 for games without a recording start
+        starts = columns['recording_start']
+        missing = np.isnat(starts)
+        hour = (starts.astype('datetime64[h]').astype(np.int64) % 24).astype(np.int8)
+        day_of_week = ((starts.astype('datetime64[D]').astype(np.int64) + 3) % 7).astype(np.int8)
+        hour[missing] = -1
+        day_of_week[missing] = -1
+        df['hour'] = hour
+        df['day_of_week'] = day_of_week
+        # Integer PEAK_LABELS index (-1 outside every bin) rather than a Categorical
+        df['peak_category'] = self._peak_bin_ids(columns['peak_multiplier'])
         
         return df
     
+    def create_analysis_dataframe(self, games):
+        """Convert raw game data (any iterable, including a generator) to a pandas DataFrame"""
+        return self._frame_from_columns(self._extract_columns(games))
+    
     def analyze_basic_patterns(self):
         """Perform basic statistical analysis of collected data"""
         if self.games_df is None:
@@ -138,6 +534,16 @@ class RugsDataAnalyzer:
         print("=" * 50)
         
         df = self.games_df
+        n_games = len(df)
+        peaks = df['peak_multiplier'].to_numpy()
+        
+        # Sums, max and peak-bin counts in a single pass over the columns
+        (n_instarugs, n_peaks, peak_sum, peak_max, duration_sum, tick_sum, event_sum,
+         peak_dist) = _basic_stats(
+            peaks, df['is_instarug'].to_numpy(), df['duration_seconds'].to_numpy(),
+            df['final_tick'].to_numpy(), df['total_events'].to_numpy(),
+            df['peak_category'].to_numpy(), len(self.PEAK_LABELS)
+        )
         
         # Basic statistics
         print(f"📊 Total Games Analyzed: {len(df)}")
@@ -146,26 +552,56 @@ class RugsDataAnalyzer:
         
         # Game outcome statistics
         print(f"\n🎯 Game Outcomes:")
-        print(f"   Instarugs: {df['is_instarug'].sum()} ({df['is_instarug'].mean()*100:.1f}%)")
-        print(f"   Average Peak: {df['peak_multiplier'].mean():.2f}x")
-        print(f"   Median Peak: {df['peak_multiplier'].median():.2f}x")
-        print(f"   Max Peak: {df['peak_multiplier'].max():.2f}x")
+        print(f"   Instarugs: {n_instarugs} ({n_instarugs/n_games*100:.1f}%)")
+        print(f"   Average Peak: {peak_sum/n_peaks if n_peaks else np.nan:.2f}x")
+        print(f"   Median Peak: {np.nanmedian(peaks) if n_peaks else np.nan:.2f}x")
+        print(f"   Max Peak: {peak_max:.2f}x")
         
         # Peak multiplier distribution
         print(f"\n📈 Peak Multiplier Distribution:")
-        peak_dist = df['peak_category'].value_counts().sort_index()
-        for category, count in peak_dist.items():
-            percentage = (count / len(df)) * 100
+        for category, count in zip(self.PEAK_LABELS, peak_dist):
+            percentage = (count / n_games) * 100
             print(f"   {category}: {count} games ({percentage:.1f}%)")
         
         # Timing analysis
         print(f"\n⏱️  Game Duration Statistics:")
-        print(f"   Average Duration: {df['duration_seconds'].mean():.1f}s")
-        print(f"   Average Final Tick: {df['final_tick'].mean():.0f}")
-        print(f"   Average Events per Game: {df['total_events'].mean():.0f}")
+        print(f"   Average Duration: {duration_sum/n_games:.1f}s")
+        print(f"   Average Final Tick: {tick_sum/n_games:.0f}")
+        print(f"   Average Events per Game: {event_sum/n_games:.0f}")
         
         return df
     
+    def _peak_bin_ids(self, peaks):
+        """Index into PEAK_LABELS for each peak, or -1 if it falls outside every bin"""
+        # side='left' keeps the bins right-closed like pd.cut; peaks <= 0 (and NaN) fall outside
+        bin_ids = np.searchsorted(self.PEAK_BINS, peaks, side='left').astype(np.int8) - 1
+        bin_ids[bin_ids >= len(self.PEAK_LABELS)] = -1
+        return bin_ids
+    
+    def _instarugs_by_prev_peak(self, prev_peak, next_rug):
+        """Per PEAK_BINS bin: games, following instarugs, and instarug probability (NaN if empty)"""
+        bin_ids = self._peak_bin_ids(prev_peak)
+        in_range = bin_ids >= 0
+        counts = np.bincount(bin_ids[in_range], minlength=len(self.PEAK_LABELS))
+        instarugs = np.bincount(bin_ids[in_range], weights=next_rug[in_range], minlength=len(self.PEAK_LABELS))
+        probabilities = np.divide(instarugs, counts, out=np.full(len(counts), np.nan), where=counts > 0)
+        return counts, instarugs, probabilities
+    
+    def _chi2_2x2(self, a, b, c, d):
+        """
+        Closed-form chi-square test of independence for a 2x2 table, with the
+        Yates continuity correction that chi2_contingency applies at dof=1
+        """
+        a, b, c, d = (float(x) for x in (a, b, c, d))
+        n = a + b + c + d
+        margins = (a + b) * (c + d) * (a + c) * (b + d)
+        if margins == 0:
+            # A zero row or column total: no evidence against independence
+            return 0.0, 1.0
+        
+        chi2 = n * max(abs(a * d - b * c) - n / 2, 0.0) ** 2 / margins
+        return chi2, chdtrc(1, chi2)
+    
     def analyze_cross_game_patterns(self):
         """Analyze patterns between consecutive games"""
         if self.games_df is None:
@@ -175,70 +611,65 @@ class RugsDataAnalyzer:
         print("\n🔗 CROSS-GAME PATTERN ANALYSIS")
         print("=" * 50)
         
-        df = self.games_df.copy()
-        
-        # Create lagged features
-        df['prev_peak'] = df['peak_multiplier'].shift(1)
-        df['prev_is_instarug'] = df['is_instarug'].shift(1)
-        df['next_is_instarug'] = df['is_instarug'].shift(-1)
+        # Pair each game's peak with whether the game right after it was an instarug.
+        # Both are views into the column arrays, so nothing is copied.
+        peaks = self.games_df['peak_multiplier'].to_numpy()
+        rug = self.games_df['is_instarug'].to_numpy()
+        prev_peak = peaks[:-1]
+        next_rug = rug[1:]
         
-        # Remove rows with NaN values
-        analysis_df = df.dropna()
-        
-        if len(analysis_df) < 10:
+        if len(prev_peak) < 10:
             print("❌ Insufficient data for cross-game analysis")
             return
         
         # Analyze instarug probability following different peak ranges
         print("🎯 Instarug Probability Following Different Peak Multipliers:")
         
-        peak_bins = [0, 2, 5, 10, 20, 50, np.inf]
-        peak_labels = ['0-2x', '2-5x', '5-10x', '10-20x', '20-50x', '50x+']
+        peak_labels = self.PEAK_LABELS
         
-        analysis_df['prev_peak_bin'] = pd.cut(analysis_df['prev_peak'], 
-                                            bins=peak_bins, labels=peak_labels)
+        # The per-bin totals also feed the 50x+ test below
+        counts, instarugs, probabilities = self._instarugs_by_prev_peak(prev_peak, next_rug)
         
-        instarug_by_peak = analysis_df.groupby('prev_peak_bin')['next_is_instarug'].agg(['count', 'sum', 'mean'])
-        instarug_by_peak.columns = ['total_games', 'instarugs', 'instarug_probability']
+        instarug_by_peak = pd.DataFrame({
+            'total_games': counts,
+            'instarugs': instarugs,
+            'instarug_probability': probabilities
+        }, index=pd.Index(peak_labels, name='prev_peak_bin'))
         
-        overall_instarug_rate = analysis_df['next_is_instarug'].mean()
+        total_games = len(next_rug)
+        total_instarugs = next_rug.sum()
+        overall_instarug_rate = total_instarugs / total_games
         
         print(f"\nOverall instarug rate: {overall_instarug_rate:.3f} ({overall_instarug_rate*100:.1f}%)")
         print("\nBy previous peak multiplier:")
         
-        for peak_range in peak_labels:
-            if peak_range in instarug_by_peak.index:
-                row = instarug_by_peak.loc[peak_range]
-                prob = row['instarug_probability']
-                count = row['total_games']
-                ratio = prob / overall_instarug_rate if overall_instarug_rate > 0 else 0
-                
-                print(f"   {peak_range}: {prob:.3f} ({prob*100:.1f}%) | "
-                      f"{count} games | {ratio:.1f}x baseline")
-        
-        # Statistical significance test for 50x+ games
-        high_multi_games = analysis_df[analysis_df['prev_peak'] >= 50]
-        other_games = analysis_df[analysis_df['prev_peak'] < 50]
-        
-        if len(high_multi_games) > 0 and len(other_games) > 0:
-            high_multi_instarug_rate = high_multi_games['next_is_instarug'].mean()
-            other_instarug_rate = other_games['next_is_instarug'].mean()
-            
-            # Chi-square test
-            from scipy.stats import chi2_contingency
+        for peak_range, count, prob in zip(peak_labels, counts, probabilities):
+            if count == 0:
+                continue
+            ratio = prob / overall_instarug_rate if overall_instarug_rate > 0 else 0
             
-            contingency_table = [
-                [high_multi_games['next_is_instarug'].sum(), 
-                 len(high_multi_games) - high_multi_games['next_is_instarug'].sum()],
-                [other_games['next_is_instarug'].sum(),
-                 len(other_games) - other_games['next_is_instarug'].sum()]
-            ]
+            print(f"   {peak_range}: {prob:.3f} ({prob*100:.1f}%) | "
+                  f"{count} games | {ratio:.1f}x baseline")
+        
+        # Statistical significance test for 50x+ games, straight from the bin totals
+        high_multi_games = counts[-1]
+        high_multi_instarugs = instarugs[-1]
+        other_games = total_games - high_multi_games
+        other_instarugs = total_instarugs - high_multi_instarugs
+        
+        if high_multi_games > 0 and other_games > 0:
+            high_multi_instarug_rate = high_multi_instarugs / high_multi_games
+            other_instarug_rate = other_instarugs / other_games
             
-            chi2, p_value, dof, expected = chi2_contingency(contingency_table)
+            # Chi-square test on the 2x2 table [[a, b], [c, d]]
+            chi2, p_value = self._chi2_2x2(
+                high_multi_instarugs, high_multi_games - high_multi_instarugs,
+                other_instarugs, other_games - other_instarugs
+            )
             
             print(f"\n📊 Statistical Test (50x+ vs Others):")
-            print(f"   50x+ instarug rate: {high_multi_instarug_rate:.3f} ({len(high_multi_games)} games)")
-            print(f"   Other instarug rate: {other_instarug_rate:.3f} ({len(other_games)} games)")
+            print(f"   50x+ instarug rate: {high_multi_instarug_rate:.3f} ({high_multi_games} games)")
+            print(f"   Other instarug rate: {other_instarug_rate:.3f} ({other_games} games)")
             print(f"   Chi-square statistic: {chi2:.3f}")
             print(f"   P-value: {p_value:.6f}")
             print(f"   Statistically significant: {'YES' if p_value < 0.05 else 'NO'}")
@@ -266,10 +697,12 @@ class RugsDataAnalyzer:
         game_ids = df['game_id'].dropna()
         if len(game_ids) > 10:
             # Check if game IDs appear sequential (would be suspicious)
-            print(f"   Game ID uniqueness: {len(game_ids.unique())} / {len(game_ids)} ({len(game_ids.unique())/len(game_ids)*100:.1f}%)")
+            unique_ids = game_ids.nunique()
+            print(f"   Game ID uniqueness: {unique_ids} / {len(game_ids)} ({unique_ids/len(game_ids)*100:.1f}%)")
         
         # 2. Peak multiplier distribution analysis
-        peaks = df['peak_multiplier'].dropna()
+        peaks = df['peak_multiplier'].to_numpy()
+        peaks = peaks[~np.isnan(peaks)]
         if len(peaks) > 50:
             # Test for uniform distribution in log space (expected for exponential decay)
             log_peaks = np.log(peaks[peaks > 0])
@@ -278,8 +711,18 @@ class RugsDataAnalyzer:
         
         # 3. Temporal patterns that shouldn't exist
         if 'hour' in df.columns:
-            hourly_instarug_rates = df.groupby('hour')['is_instarug'].mean()
-            hourly_variance = hourly_instarug_rates.var()
+            # Per-hour instarug rate over the hours that have games: games and
+            # instarugs per hour are two 24-bin counts, with no sort or grouping
+            # (games without a start time, hour -1, are left out)
+            hours = df['hour'].to_numpy()
+            timed = hours >= 0
+            hours = hours[timed]
+            rug = df['is_instarug'].to_numpy()[timed]
+            counts = np.bincount(hours, minlength=24)
+            instarugs = np.bincount(hours, weights=rug, minlength=24)
+            observed = counts > 0
+            hourly_instarug_rates = instarugs[observed] / counts[observed]
+            hourly_variance = hourly_instarug_rates.var(ddof=1)
             print(f"   Hourly instarug rate variance: {hourly_variance:.6f}")
             
             # Check for suspicious hourly patterns
@@ -302,6 +745,7 @@ class RugsDataAnalyzer:
         print("=" * 50)
         
         df = self.games_df
+        peaks = df['peak_multiplier'].to_numpy()
         
         # Set up the plotting style
         plt.style.use('seaborn-v0_8')
@@ -309,44 +753,48 @@ class RugsDataAnalyzer:
         fig.suptitle('Rugs.fun Data Collection Analysis', fontsize=16, fontweight='bold')
         
         # 1. Peak multiplier distribution
-        axes[0, 0].hist(df['peak_multiplier'], bins=50, alpha=0.7, edgecolor='black')
+        # Binned with np.histogram over the visible range, drawn as plain bars
+        peak_xmax = min(100, peaks.max())
+        counts, edges = np.histogram(peaks, bins=50, range=(0, peak_xmax))
+        axes[0, 0].bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                       alpha=0.7, edgecolor='black')
         axes[0, 0].set_xlabel('Peak Multiplier')
         axes[0, 0].set_ylabel('Frequency')
         axes[0, 0].set_title('Peak Multiplier Distribution')
-        axes[0, 0].set_xlim(0, min(100, df['peak_multiplier'].max()))
+        axes[0, 0].set_xlim(0, peak_xmax)
         
         # 2. Instarug analysis
         if len(df) > 1:
-            df_lag = df.dropna(subset=['peak_multiplier'])
-            df_lag['prev_peak'] = df_lag['peak_multiplier'].shift(1)
-            df_lag['next_is_instarug'] = df_lag['is_instarug'].shift(-1)
-            df_lag = df_lag.dropna()
+            # Consecutive-game views; nothing is attached to the DataFrame
+            prev_peak = peaks[:-1]
+            next_rug = df['is_instarug'].to_numpy()[1:]
             
-            if len(df_lag) > 10:
-                # Create peak bins for visualization
-                df_lag['prev_peak_bin'] = pd.cut(df_lag['prev_peak'], 
-                                               bins=[0, 2, 5, 10, 20, 50, np.inf],
-                                               labels=['0-2x', '2-5x', '5-10x', '10-20x', '20-50x', '50x+'])
-                
-                instarug_rates = df_lag.groupby('prev_peak_bin')['next_is_instarug'].mean()
+            if len(prev_peak) > 10:
+                _, _, instarug_rates = self._instarugs_by_prev_peak(prev_peak, next_rug)
                 
-                bars = axes[0, 1].bar(range(len(instarug_rates)), instarug_rates.values, alpha=0.7)
+                bars = axes[0, 1].bar(range(len(instarug_rates)), instarug_rates, alpha=0.7)
                 axes[0, 1].set_xlabel('Previous Game Peak Multiplier')
                 axes[0, 1].set_ylabel('Instarug Probability')
                 axes[0, 1].set_title('Instarug Probability by Previous Peak')
                 axes[0, 1].set_xticks(range(len(instarug_rates)))
-                axes[0, 1].set_xticklabels(instarug_rates.index, rotation=45)
+                axes[0, 1].set_xticklabels(self.PEAK_LABELS, rotation=45)
                 
                 # Add overall average line
-                overall_rate = df_lag['next_is_instarug'].mean()
+                overall_rate = next_rug.mean()
                 axes[0, 1].axhline(y=overall_rate, color='red', linestyle='--', 
                                  label=f'Overall Average: {overall_rate:.3f}')
                 axes[0, 1].legend()
         
         # 3. Collection timeline
         if 'recording_start' in df.columns:
-            df_time = df.set_index('recording_start').resample('H').size()
-            axes[1, 0].plot(df_time.index, df_time.values, marker='o', markersize=3)
+            # Games per hour: bincount of hours since the first game (NaT skipped)
+            starts = df['recording_start'].to_numpy()
+            hours = starts[~np.isnat(starts)].astype('datetime64[h]').astype(np.int64)
+            if len(hours):
+                origin = hours.min()
+                games_per_hour = np.bincount(hours - origin)
+                hour_starts = (origin + np.arange(len(games_per_hour))).astype('datetime64[h]')
+                axes[1, 0].plot(hour_starts, games_per_hour, marker='o', markersize=3)
             axes[1, 0].set_xlabel('Time')
             axes[1, 0].set_ylabel('Games per Hour')
             axes[1, 0].set_title('Collection Rate Over Time')
@@ -354,8 +802,8 @@ class RugsDataAnalyzer:
         
         # 4. Game duration vs peak multiplier
         if len(df) > 10:
-            scatter = axes[1, 1].scatter(df['duration_seconds'], df['peak_multiplier'], 
-                                       alpha=0.6, c=df['is_instarug'], cmap='RdYlBu')
+            scatter = axes[1, 1].scatter(df['duration_seconds'].to_numpy(), peaks, 
+                                       alpha=0.6, c=df['is_instarug'].to_numpy(), cmap='RdYlBu')
             axes[1, 1].set_xlabel('Game Duration (seconds)')
             axes[1, 1].set_ylabel('Peak Multiplier')
             axes[1, 1].set_title('Duration vs Peak Multiplier')
@@ -383,37 +831,22 @@ class RugsDataAnalyzer:
         print("\n🤖 BUILDING PREDICTION MODEL")
         print("=" * 50)
         
-        df = self.games_df.copy()
+        df = self.games_df
         
         # Create sequence features (last N games)
         sequence_length = 5
-        features = []
-        targets = []
         
-        for i in range(sequence_length, len(df)):
-            # Features: previous N games
-            sequence_features = []
-            for j in range(sequence_length):
-                game_idx = i - sequence_length + j
-                sequence_features.extend([
-                    df.iloc[game_idx]['peak_multiplier'],
-                    df.iloc[game_idx]['final_tick'],
-                    1 if df.iloc[game_idx]['is_instarug'] else 0,
-                    df.iloc[game_idx]['duration_seconds']
-                ])
-            
-            features.append(sequence_features)
-            
-            # Target: is next game an instarug?
-            targets.append(1 if df.iloc[i]['is_instarug'] else 0)
+        peaks = df['peak_multiplier'].to_numpy()
+        ticks = df['final_tick'].to_numpy()
+        rug = df['is_instarug'].to_numpy(dtype=np.int8)
+        durations = df['duration_seconds'].to_numpy()
         
-        if len(features) < 50:
-            print(f"❌ Insufficient sequence data: {len(features)} samples")
+        n_samples = len(df) - sequence_length
+        if n_samples < 50:
+            print(f"❌ Insufficient sequence data: {n_samples} samples")
             return
         
-        # Convert to numpy arrays
-        X = np.array(features)
-        y = np.array(targets)
+        X, y = _sequence_windows(peaks, ticks, rug, durations, sequence_length)
         
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import websockets
 import json
@@ -5,12 +6,505 @@ import hashlib
 import datetime
 import pandas as pd
 import numpy as np
-from collections import defaultdict
-from scipy.stats import chisquare, kstest, binom_test
-import matplotlib.pyplot as plt
+from numpy.lib.stride_tricks import sliding_window_view
+from collections import defaultdict, Counter
+from dateutil.tz import tzlocal
+from scipy.stats import chisquare, binom, binomtest, false_discovery_control, t as t_dist
+from matplotlib.figure import Figure
 from matplotlib.colors import LinearSegmentedColormap
 import time
 import os
+import ssl
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    
+    def _json_dumps_results(obj):
+        """Indented JSON for analysis results, which hold numpy values and int keys"""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+    
+    def _to_serializable(obj):
+        """json.dumps default= hook for numpy values and datetimes"""
+        if isinstance(obj, np.integer):
+            return int(obj)
+        elif isinstance(obj, np.floating):
+            return float(obj)
+        elif isinstance(obj, np.ndarray):
+            return obj.tolist()
+        elif isinstance(obj, datetime.datetime):
+            return obj.isoformat()
+        return obj
+    
+    def _json_dumps_results(obj):
+        """Indented JSON for analysis results, which hold numpy values and int keys"""
+        return json.dumps(obj, default=_to_serializable, indent=2).encode()
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; asyncio's default event loop is used instead
+    uvloop = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the numpy paths below are used instead
+    njit = None
+
+# Hash constructors by name
+HASH_CTORS = {
+    'md5': hashlib.md5,
+    'sha1': hashlib.sha1,
+    'sha256': hashlib.sha256,
+}
+
+# Hash algorithms tried for every seed candidate, in order of precedence. SHA-1
+# costs a full extra hashing pass per candidate while adding little over the
+# SHA-256 prefix matches, so it is only tried on request (--include-sha1)
+HASH_ALGOS = ('md5', 'sha256')
+HASH_ALGOS_WITH_SHA1 = ('md5', 'sha1', 'sha256')
+
+# Secrets that might be mixed into a seed, and the salt formats they might be used with
+COMMON_SECRETS = (
+    "rugs.fun", "rugsfun", "rug", "rugpull",
+    "crypto", "game", "seed", "random",
+    "bitcoin", "ethereum", "secret", "provably-fair"
+)
+SALT_FORMATS = (
+    "{}", "{}_salt", "salt_{}", "{}_key", "key_{}", "{}_seed", "seed_{}"
+)
+
+# Inputs hashed for each time value and salt, in the order _candidates tries them:
+# time + salt, salt + time, time only, salt only
+INPUT_KINDS = ('TimeSecret', 'SecretTime', 'Time', 'Secret')
+
+# Inputs hashed per worker task when batches are split across processes;
+# batches no bigger than this are hashed in-process
+HASH_CHUNK_SIZE = 50_000
+
+
+@lru_cache(maxsize=None)
+def _salt(secret, salt_format):
+    """salt_format filled in with secret, encoded for hashing"""
+    return salt_format.format(secret).encode()
+
+
+@lru_cache(maxsize=None)
+def _primed(hash_type, data):
+    """A hash_type context that has consumed data; .copy() it before updating"""
+    return HASH_CTORS[hash_type](data)
+
+
+# Hash algorithms searched, as (name, constructor), and hash contexts primed
+# with each salt, set up once per worker process by _init_seed_search (hash
+# objects can't be pickled across processes)
+_search_algos = ()
+_salt_contexts = []
+
+
+def _init_seed_search(salts, hash_algos):
+    """Prime a context per hash_algos entry with each (secret, salt_format, salt) combination"""
+    global _search_algos, _salt_contexts
+    _search_algos = tuple((name, HASH_CTORS[name]) for name in hash_algos)
+    _salt_contexts = []
+    for secret, salt_format, salt in salts:
+        salt_bytes = _salt(secret, salt_format)
+        salt_primed = [_primed(name, salt_bytes) for name in hash_algos]
+        _salt_contexts.append((secret, salt_format, salt, salt_bytes, salt_primed,
+                               [h.digest() for h in salt_primed]))
+
+
+def _digests_after(primed, data):
+    """Raw digests of copies of primed hash contexts, each extended with data"""
+    digests = []
+    for hasher in primed:
+        hasher = hasher.copy()
+        hasher.update(data)
+        digests.append(hasher.digest())
+    return digests
+
+
+def _hash_many(ctor, inputs):
+    """Raw digests of every input under one hash constructor, in a single batched pass"""
+    return [hasher.digest() for hasher in map(ctor, inputs)]
+
+
+def _hash_chunk(hash_type, inputs):
+    """_hash_many by algorithm name, for running in a worker process"""
+    return _hash_many(HASH_CTORS[hash_type], inputs)
+
+
+def _hash_batches(inputs, before_fork=None):
+    """
+    Raw digests of every input under each algorithm in HASH_CTORS, by name.
+    Large batches are split into chunks hashed in parallel worker processes
+    when there is more than one core to run them on; before_fork, if given,
+    is called first, to stop threads that mustn't be live when they fork.
+    """
+    if len(inputs) <= HASH_CHUNK_SIZE or (os.cpu_count() or 1) < 2:
+        return {hash_type: _hash_many(ctor, inputs) for hash_type, ctor in HASH_CTORS.items()}
+    
+    chunks = [inputs[i:i + HASH_CHUNK_SIZE] for i in range(0, len(inputs), HASH_CHUNK_SIZE)]
+    tasks = [(hash_type, chunk) for hash_type in HASH_CTORS for chunk in chunks]
+    if before_fork is not None:
+        before_fork()
+    with ProcessPoolExecutor() as pool:
+        results = pool.map(_hash_chunk, *zip(*tasks))
+        digests = {hash_type: [] for hash_type in HASH_CTORS}
+        for (hash_type, _), chunk_digests in zip(tasks, results):
+            digests[hash_type] += chunk_digests
+    return digests
+
+
+def _game_time(game):
+    """
+    When a game started, as a datetime: from 'ts_ns' (epoch nanoseconds) in
+    local time, or by parsing the ISO 'timestamp' of older data. None if the
+    game has neither.
+    """
+    ts_ns = game.get('ts_ns')
+    if ts_ns is not None:
+        seconds, ns = divmod(ts_ns, 1_000_000_000)
+        return datetime.datetime.fromtimestamp(seconds, tzlocal()).replace(microsecond=ns // 1000)
+    if game.get('timestamp'):
+        return datetime.datetime.fromisoformat(game['timestamp'])
+    return None
+
+
+def _utc_start(dt):
+    """dt as a UTC datetime, reading a naive dt as local time like datetime.timestamp()"""
+    if dt.tzinfo is None:
+        return datetime.datetime.fromtimestamp(dt.timestamp(), datetime.timezone.utc)
+    return dt.astimezone(datetime.timezone.utc)
+
+
+def _frame_times(games, timestamps):
+    """
+    Vectorized _game_time over a whole data set, from each game's 'ts_ns' or
+    else its 'timestamp' string. Returns the starts as a tz-aware local-time
+    Series, and the UTC offset of the clock each start was read on, for its
+    calendar fields: local time for 'ts_ns' and naive strings (as
+    datetime.timestamp() treats them), a string's own offset otherwise.
+    """
+    local = tzlocal()
+    ts_ns = pd.Series(pd.array([game.get('ts_ns') for game in games], dtype='Int64'))
+    times = pd.to_datetime(ts_ns, unit='ns', utc=True)
+    walls = times.dt.tz_convert(local).dt.tz_localize(None)
+    
+    legacy = times.isna().to_numpy() & timestamps.notna().to_numpy()
+    if legacy.any():
+        strings = timestamps[legacy].to_numpy()
+        try:
+            parsed = pd.Series(pd.to_datetime(strings, format='ISO8601'))
+        except ValueError:
+            # Offsets differ between strings, or only some have one: parse each
+            parsed = [datetime.datetime.fromisoformat(string) for string in strings]
+            starts = pd.Series(pd.to_datetime([_utc_start(dt) for dt in parsed], utc=True))
+            legacy_walls = pd.Series(pd.to_datetime([dt.replace(tzinfo=None) for dt in parsed]))
+        else:
+            if parsed.dt.tz is None:
+                # Earlier offset when ambiguous, like datetime.timestamp(); wall
+                # times skipped by a DST change don't survive the round trip and
+                # are left to _utc_start
+                legacy_walls = parsed
+                localized = parsed.dt.tz_localize(local, ambiguous=np.ones(len(parsed), dtype=bool),
+                                                  nonexistent='shift_forward')
+                starts = localized.dt.tz_convert('UTC')
+                gaps = (localized.dt.tz_localize(None) != parsed).to_numpy()
+                if gaps.any():
+                    starts[gaps] = pd.Series(pd.to_datetime(
+                        [_utc_start(dt) for dt in parsed[gaps].dt.to_pydatetime()], utc=True)).to_numpy()
+            else:
+                legacy_walls = parsed.dt.tz_localize(None)
+                starts = parsed.dt.tz_convert('UTC')
+        times[legacy] = starts.to_numpy()
+        walls[legacy] = legacy_walls.to_numpy()
+    return times.dt.tz_convert(local), walls - times.dt.tz_localize(None)
+
+
+def _time_formats(dt, game_id):
+    """Every time-derived string a seed might have been generated from, by format name"""
+    return {
+        'epoch': str(int(dt.timestamp())),
+        'epoch_ms': str(int(dt.timestamp() * 1000)),
+        'date': dt.strftime('%Y%m%d'),
+        'time': dt.strftime('%H%M%S'),
+        'datetime': dt.strftime('%Y%m%d%H%M%S'),
+        'year': dt.strftime('%Y'),
+        'month': dt.strftime('%m'),
+        'day': dt.strftime('%d'),
+        'hour': dt.strftime('%H'),
+        'minute': dt.strftime('%M'),
+        'second': dt.strftime('%S'),
+        'microsecond': str(dt.microsecond),
+        'game_id': game_id,
+    }
+
+
+def _valid_ymd(date_part):
+    """True when a game ID date part looks like a plausible YYYYMMDD date"""
+    if len(date_part) != 8:
+        return False
+    try:
+        year = int(date_part[:4])
+        month = int(date_part[4:6])
+        day = int(date_part[6:8])
+    except ValueError:
+        return False
+    return 2000 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31
+
+
+def _hex_int(id_part):
+    """Parse a game ID part as hexadecimal, or None if it isn't"""
+    try:
+        return int(id_part, 16)
+    except ValueError:
+        return None
+
+
+def _pearson(x, ys):
+    """
+    Pearson correlation of x with each row of ys (or with ys itself if it is
+    1-D), and two-sided p-values from the t distribution. All rows share one
+    np.corrcoef call, so several ID-derived series can be tested at once.
+    """
+    x = np.asarray(x, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    r = np.corrcoef(x, np.atleast_2d(ys))[0, 1:]
+    dof = len(x) - 2
+    with np.errstate(divide='ignore'):
+        t_stat = r * np.sqrt(dof / (1.0 - r ** 2))
+    p = 2 * t_dist.sf(np.abs(t_stat), dof)
+    return (r, p) if ys.ndim > 1 else (float(r[0]), float(p[0]))
+
+
+def _binomtest_pvalues(k, n, p):
+    """
+    Two-sided scipy.stats.binomtest(k, n, p).pvalue for arrays of k and p at
+    once: the probability of every outcome no likelier than k. The edge of the
+    tail on the far side of the mode is found by bisection, as binomtest does,
+    with all tests stepping together.
+    """
+    k = np.asarray(k, dtype=np.int64)
+    p = np.asarray(p, dtype=float)
+    d = binom.pmf(k, n, p) * (1 + 1e-7)
+    below = k < p * n
+    
+    # First index past the mode whose pmf is <= d (k below the mode), or first
+    # index up to the mode whose pmf is > d (k above it); n + 1 / mode + 1 if none
+    lo = np.where(below, np.ceil(p * n), 0).astype(np.int64)
+    hi = np.where(below, n + 1, np.floor(p * n) + 1).astype(np.int64)
+    while np.any(lo < hi):
+        mid = (lo + hi) // 2
+        pmf = binom.pmf(mid, n, p)
+        found = np.where(below, pmf <= d, pmf > d) & (lo < hi)
+        hi = np.where(found, mid, hi)
+        lo = np.where(~found & (lo < hi), mid + 1, lo)
+    
+    p_values = np.where(below,
+                        binom.cdf(k, n, p) + binom.sf(lo - 1, n, p),
+                        binom.cdf(lo - 1, n, p) + binom.sf(k - 1, n, p))
+    return np.where(k == p * n, 1.0, np.minimum(1.0, p_values))
+
+
+def _seeds_to_bits(seeds):
+    """Unpack hex seeds into an (N, bits) 0/1 uint8 matrix, MSB first"""
+    return np.unpackbits(np.stack([np.frombuffer(bytes.fromhex(seed), dtype=np.uint8) for seed in seeds]), axis=1)
+
+
+def _unique_seeds(seeds):
+    """
+    Distinct seeds in order of first appearance, each seed's index into them,
+    and how many times each occurs
+    """
+    inverse, unique = pd.factorize(seeds)
+    return unique, inverse, np.bincount(inverse, minlength=len(unique))
+
+
+def _candidates(time_bytes_list):
+    """
+    Digests of every input the search tries for one game's encoded time values,
+    one per searched algorithm, ordered by time value, then salt, then input
+    (time + salt, salt + time, time only, salt only). Runs in a worker process
+    after _init_seed_search.
+    """
+    digests = []
+    for time_bytes in time_bytes_list:
+        # Contexts primed with the time value, for time + salt inputs
+        time_primed = [ctor(time_bytes) for _, ctor in _search_algos]
+        time_digests = [h.digest() for h in time_primed]
+        
+        # Try with different secrets
+        for _, _, _, salt_bytes, salt_primed, salt_digests in _salt_contexts:
+            digests += _digests_after(time_primed, salt_bytes)  # TimeSecret
+            digests += _digests_after(salt_primed, time_bytes)  # SecretTime
+            digests += time_digests                             # Time only
+            digests += salt_digests                             # Secret only
+    return digests
+
+
+def _prefix_hits_numpy(prefixes, seed_prefix):
+    """Which rows of the (candidates, 8) uint8 prefix matrix equal seed_prefix"""
+    return (prefixes == seed_prefix).all(axis=1)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _prefix_hits(prefixes, seed_prefix):
+        """Numba version of _prefix_hits_numpy, stopping at each row's first differing byte"""
+        hits = np.zeros(prefixes.shape[0], dtype=np.bool_)
+        for i in range(prefixes.shape[0]):
+            for j in range(prefixes.shape[1]):
+                if prefixes[i, j] != seed_prefix[j]:
+                    break
+            else:
+                hits[i] = True
+        return hits
+else:
+    _prefix_hits = _prefix_hits_numpy
+
+
+def _autocorr_numpy(bits, lag_max):
+    """
+    Each row's mean of bits[i] * bits[i + lag] for lags 1..lag_max, as an
+    (N, lag_max) array. The sums for every lag come from one FFT per row
+    (zero-padded to 2n so lags don't wrap around; the sums are integers).
+    """
+    n = bits.shape[1]
+    lags = np.arange(1, lag_max + 1)
+    spectrum = np.fft.rfft(bits.astype(np.float64), n=2 * n, axis=1)
+    lag_sums = np.rint(np.fft.irfft(spectrum * np.conj(spectrum), n=2 * n, axis=1)[:, lags])
+    return lag_sums / (n - lags)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _autocorr(bits, lag_max):
+        """Numba version of _autocorr_numpy, summing the products directly"""
+        n_rows, n = bits.shape
+        out = np.empty((n_rows, lag_max))
+        for k in range(n_rows):
+            for lag in range(1, lag_max + 1):
+                c = 0
+                for i in range(n - lag):
+                    c += np.int64(bits[k, i]) * np.int64(bits[k, i + lag])
+                out[k, lag - 1] = c / (n - lag)
+        return out
+else:
+    _autocorr = _autocorr_numpy
+
+
+def _search_seed(index, seed, time_vals):
+    """
+    Try every time value / secret / salt / hash combination against one seed.
+    Runs in a worker process after _init_seed_search; returns the matches found.
+    """
+    # Compare raw digest bytes against the decoded seed; 16 hex chars = 8 bytes
+    try:
+        seed_bytes = bytes.fromhex(seed)
+    except ValueError:
+        return []  # Not hex, so it can't equal or start with any hash
+    if len(seed_bytes) < 8:
+        return []  # Too short to start with 16 hex chars of any hash
+    
+    # Every match needs the seed to share an 8-byte prefix with one of the
+    # hashes, so scan all candidate digests' prefixes at once
+    n_algos = len(_search_algos)
+    all_digests = _candidates([time_val.encode() for _, time_val in time_vals])
+    prefixes = np.frombuffer(b''.join(digest[:8] for digest in all_digests), dtype=np.uint8).reshape(-1, 8)
+    hits = _prefix_hits(prefixes, np.frombuffer(seed_bytes[:8], dtype=np.uint8)).reshape(-1, n_algos)
+    
+    # Only hits need their time value, secret and input spelled out
+    found = []
+    for row in np.flatnonzero(hits.any(axis=1)):
+        time_idx, rest = divmod(int(row), len(INPUT_KINDS) * len(_salt_contexts))
+        salt_idx, kind = divmod(rest, len(INPUT_KINDS))
+        time_key, time_val = time_vals[time_idx]
+        secret, salt_format, salt = _salt_contexts[salt_idx][:3]
+        test_input = (time_val + salt, salt + time_val, time_val, salt)[kind]
+        digests = all_digests[row * n_algos:(row + 1) * n_algos]
+        
+        # An exact match on any algorithm takes precedence; otherwise take the
+        # first algorithm whose first 16 hex chars (8 bytes) match
+        if seed_bytes in digests:
+            algo, match_type = digests.index(seed_bytes), 'exact'
+        else:
+            algo, match_type = int(np.argmax(hits[row])), 'partial_16'
+        
+        found.append({
+            'index': index,
+            'seed': seed,
+            'time_format': time_key,
+            'secret': secret,
+            'salt_format': salt_format,
+            'input': test_input,
+            'kind': INPUT_KINDS[kind],
+            'hash_type': _search_algos[algo][0],
+            'match_type': match_type
+        })
+    
+    return found
+
+
+def _plot_time_patterns(time_diffs, bit_positions, bit_p_values):
+    """
+    Save the time pattern figures. Uses standalone Figures rather than pyplot,
+    so it can run on a background thread and nothing is left open afterwards.
+    """
+    # Visualize time differences
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+    ax.hist(time_diffs, bins=50, alpha=0.7)
+    ax.set_title('Distribution of Time Between Games')
+    ax.set_xlabel('Time (seconds)')
+    ax.set_ylabel('Frequency')
+    fig.savefig('time_differences.png')
+    
+    # Visualize bit patterns
+    if bit_positions:
+        fig = Figure(figsize=(12, 6))
+        ax = fig.subplots()
+        ax.bar(bit_positions, -np.log10(bit_p_values), alpha=0.7)
+        ax.axhline(-np.log10(0.05), color='r', linestyle='--', label='p=0.05')
+        ax.set_title('Significance of Bit Position Patterns (-log10 p-value)')
+        ax.set_xlabel('Bit Position')
+        ax.set_ylabel('-log10(p-value)')
+        ax.legend()
+        fig.savefig('bit_patterns.png')
+
+
+def _plot_binary_patterns(binary_matrix, lags, autocorrs):
+    """Save the binary pattern figures, like _plot_time_patterns"""
+    # Create visual representation of binary seeds, with a custom colormap
+    # (white for 0, black for 1)
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+    cmap = LinearSegmentedColormap.from_list('binary', ['white', 'black'])
+    
+    image = ax.imshow(binary_matrix, cmap=cmap, aspect='auto')
+    ax.set_title('Binary Representation of Server Seeds')
+    ax.set_xlabel('Bit Position')
+    ax.set_ylabel('Seed Index')
+    fig.colorbar(image, ax=ax, ticks=[0, 1], label='Bit Value')
+    fig.savefig('binary_heatmap.png')
+    
+    # Visualize autocorrelation
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+    ax.bar(lags, autocorrs, alpha=0.7)
+    ax.set_title('Average Autocorrelation in Binary Seeds')
+    ax.set_xlabel('Lag')
+    ax.set_ylabel('Autocorrelation')
+    fig.savefig('autocorrelation.png')
+
 
 class RugsTimeSeedAnalyzer:
     """
@@ -19,7 +513,13 @@ class RugsTimeSeedAnalyzer:
     might be correlated with timestamps.
     """
     
-    def __init__(self, websocket_url=None, data_path=None):
+    # Per-game fields kept in the columnar games_df used by the analysis methods
+    GAME_COLUMNS = [
+        'gameId', 'serverSeedHash', 'serverSeed', 'ts_ns', 'timestamp',
+        'peakMultiplier', 'finalTick'
+    ]
+    
+    def __init__(self, websocket_url=None, data_path=None, hash_algos=HASH_ALGOS):
         """
         Initialize with either a WebSocket URL for live data collection
         or a path to previously collected data.
@@ -27,10 +527,13 @@ class RugsTimeSeedAnalyzer:
         Parameters:
             websocket_url (str): WebSocket URL for Rugs.fun
             data_path (str): Path to JSON/JSONL file with historical game data
+            hash_algos (tuple): Names of the hash algorithms the seed brute force tries
         """
         self.websocket_url = websocket_url
         self.data_path = data_path
+        self.hash_algos = hash_algos
         self.games = []
+        self.games_df = None
         self.current_game = None
         self.connection_active = False
         
@@ -39,10 +542,36 @@ class RugsTimeSeedAnalyzer:
         self.hash_candidates = []
         self.bit_patterns = {}
         
+        # Figures are rendered and saved on a background thread, started on
+        # first use, so the analysis methods return without waiting on them
+        self._plot_pool = None
+        self._plot_futures = []
+        
+    def _submit_plot(self, plot, *args):
+        """Run a _plot_* function on the background plotting thread"""
+        if self._plot_pool is None:
+            self._plot_pool = ThreadPoolExecutor(max_workers=1)
+        self._plot_futures.append(self._plot_pool.submit(plot, *args))
+    
+    def wait_for_plots(self):
+        """
+        Wait until every submitted figure has been saved and stop the plotting
+        thread, re-raising the first plotting error if any
+        """
+        if self._plot_pool is None:
+            return
+        self._plot_pool.shutdown(wait=True)
+        self._plot_pool = None
+        futures, self._plot_futures = self._plot_futures, []
+        for future in futures:
+            future.result()
+    
     async def connect(self):
         """Establish WebSocket connection to Rugs.fun"""
         try:
-            self.connection = await websockets.connect(self.websocket_url)
+            # Unbounded receive queue, so analysis bursts between recv() calls
+            # don't stall the connection with backpressure
+            self.connection = await websockets.connect(self.websocket_url, max_queue=None)
             self.connection_active = True
             print("Connected to Rugs.fun WebSocket")
             return True
@@ -64,10 +593,14 @@ class RugsTimeSeedAnalyzer:
         
         game_count = 0
         
+        # Completed games are appended to one JSONL file as they finish
+        self._jsonl_fp = open('seed_data.jsonl', 'ab', buffering=1 << 20)
+        
         try:
             while game_count < max_games:
                 message = await self.connection.recv()
-                data = json.loads(message)
+                recv_ns = time.time_ns()
+                data = _json_loads(message)
                 
                 # Process different event types
                 if 'type' in data:
@@ -79,11 +612,8 @@ class RugsTimeSeedAnalyzer:
                             self.current_game = {
                                 'gameId': state.get('gameId'),
                                 'serverSeedHash': state.get('serverSeedHash'),
-                                'timestamp': datetime.datetime.now().isoformat(),
-                                'microsecond': datetime.datetime.now().microsecond,
-                                'second': datetime.datetime.now().second,
-                                'minute': datetime.datetime.now().minute,
-                                'hour': datetime.datetime.now().hour
+                                # Receipt time in epoch nanoseconds; calendar fields are derived when analyzing
+                                'ts_ns': recv_ns
                             }
                             print(f"New game started: {self.current_game['gameId']}")
                         
@@ -95,6 +625,8 @@ class RugsTimeSeedAnalyzer:
                             
                             # Store the completed game
                             self.games.append(self.current_game)
+                            self.games_df = None
+                            self._jsonl_fp.write(_json_dumps(self.current_game) + b'\n')
                             
                             print(f"Game ended: {self.current_game['gameId']}, Seed: {self.current_game['serverSeed'][:10]}...")
                             
@@ -103,9 +635,9 @@ class RugsTimeSeedAnalyzer:
                             
                             game_count += 1
                             
-                            # Save progress every 10 games
+                            # Flush progress to disk every 10 games
                             if game_count % 10 == 0:
-                                self.save_data(f"seed_data_{game_count}.json")
+                                self._jsonl_fp.flush()
                             
                             # Run quick analysis every 50 games
                             if game_count % 50 == 0:
@@ -118,6 +650,7 @@ class RugsTimeSeedAnalyzer:
             print(f"Error in data collection: {e}")
         
         finally:
+            self._jsonl_fp.close()
             self.save_data("final_seed_data.json")
     
     def load_data(self):
@@ -130,15 +663,15 @@ class RugsTimeSeedAnalyzer:
             # Check file extension
             if self.data_path.endswith('.jsonl'):
                 # JSONL format (one JSON object per line)
-                self.games = []
-                with open(self.data_path, 'r') as f:
-                    for line in f:
-                        self.games.append(json.loads(line))
+                with open(self.data_path, 'rb') as f:
+                    self.games = [_json_loads(line) for line in f]
             else:
                 # Regular JSON format
-                with open(self.data_path, 'r') as f:
-                    self.games = json.load(f)
+                with open(self.data_path, 'rb') as f:
+                    self.games = _json_loads(f.read())
             
+            self.games_df = None
+            self._games_frame()
             print(f"Loaded {len(self.games)} games from {self.data_path}")
             return True
         
@@ -146,487 +679,64 @@ class RugsTimeSeedAnalyzer:
             print(f"Error loading data: {e}")
             return False
     
+    def _games_frame(self):
+        """
+        Columnar (one column per GAME_COLUMNS field) view of self.games, built
+        on first use; whatever changes self.games resets games_df to None. The 'time'
+        column holds each game's start as a tz-aware local timestamp, read from
+        'ts_ns' or from the 'timestamp' string of older data, and 'utc_offset'
+        the offset of the clock it was recorded on (see _frame_times).
+        """
+        if self.games_df is None:
+            self.games_df = pd.DataFrame.from_records(self.games, columns=self.GAME_COLUMNS)
+            self.games_df['time'], self.games_df['utc_offset'] = _frame_times(self.games, self.games_df['timestamp'])
+        return self.games_df
+    
     def save_data(self, filename):
         """Save collected data to file"""
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.games, f)
+            with open(filename, 'wb') as f:
+                f.write(_json_dumps(self.games))
             print(f"Saved {len(self.games)} games to {filename}")
         except Exception as e:
             print(f"Error saving data: {e}")
     
-    async def run_quick_analysis(self):
-        """Run a quick analysis on collected data so far"""
-        if len(self.games) < 10:
-            print("Not enough games for analysis")
-            return
-        
-        # Check for time patterns in the last 50 games
-        recent_games = self.games[-50:]
-        
-        # Extract timestamps and seeds
-        timestamps = []
-        seeds = []
-        
-        for game in sample:
-            if 'timestamp' in game and 'serverSeed' in game:
-                timestamps.append(game['timestamp'])
-                seeds.append(game['serverSeed'])
-        
-        # Try different combinations
-        found_patterns = []
-        
-        for i, (ts, seed) in enumerate(zip(timestamps, seeds)):
-            dt = datetime.datetime.fromisoformat(ts)
-            
-            # Different time formats to try
-            time_formats = {
-                'epoch': str(int(dt.timestamp())),
-                'epoch_ms': str(int(dt.timestamp() * 1000)),
-                'date': dt.strftime('%Y%m%d'),
-                'time': dt.strftime('%H%M%S'),
-                'datetime': dt.strftime('%Y%m%d%H%M%S'),
-                'year': dt.strftime('%Y'),
-                'month': dt.strftime('%m'),
-                'day': dt.strftime('%d'),
-                'hour': dt.strftime('%H'),
-                'minute': dt.strftime('%M'),
-                'second': dt.strftime('%S'),
-                'microsecond': str(dt.microsecond),
-                'game_id': game['gameId'] if 'gameId' in game else '',
-            }
-            
-            # Try combinations
-            for time_key, time_val in time_formats.items():
-                # Skip empty values
-                if not time_val:
-                    continue
-                
-                # Try with different secrets
-                for secret in common_secrets:
-                    for salt_format in salt_formats:
-                        salt = salt_format.format(secret)
-                        
-                        # Test different combinations
-                        test_inputs = [
-                            time_val + salt,  # TimeSecret
-                            salt + time_val,  # SecretTime
-                            time_val,         # Time only
-                            salt,             # Secret only
-                        ]
-                        
-                        for test_input in test_inputs:
-                            # Try different hash algorithms
-                            hash_md5 = hashlib.md5(test_input.encode()).hexdigest()
-                            hash_sha1 = hashlib.sha1(test_input.encode()).hexdigest()
-                            hash_sha256 = hashlib.sha256(test_input.encode()).hexdigest()
-                            
-                            # Check for exact matches
-                            if seed == hash_md5:
-                                found_patterns.append({
-                                    'index': i,
-                                    'seed': seed,
-                                    'time_format': time_key,
-                                    'secret': secret,
-                                    'salt_format': salt_format,
-                                    'input': test_input,
-                                    'hash_type': 'md5',
-                                    'match_type': 'exact'
-                                })
-                                print(f"MATCH! Seed {seed[:10]}... = MD5({test_input})")
-                            
-                            elif seed == hash_sha1:
-                                found_patterns.append({
-                                    'index': i,
-                                    'seed': seed,
-                                    'time_format': time_key,
-                                    'secret': secret,
-                                    'salt_format': salt_format,
-                                    'input': test_input,
-                                    'hash_type': 'sha1',
-                                    'match_type': 'exact'
-                                })
-                                print(f"MATCH! Seed {seed[:10]}... = SHA1({test_input})")
-                            
-                            elif seed == hash_sha256:
-                                found_patterns.append({
-                                    'index': i,
-                                    'seed': seed,
-                                    'time_format': time_key,
-                                    'secret': secret,
-                                    'salt_format': salt_format,
-                                    'input': test_input,
-                                    'hash_type': 'sha256',
-                                    'match_type': 'exact'
-                                })
-                                print(f"MATCH! Seed {seed[:10]}... = SHA256({test_input})")
-                            
-                            # Check for partial matches (first 16 chars)
-                            elif seed.startswith(hash_md5[:16]):
-                                found_patterns.append({
-                                    'index': i,
-                                    'seed': seed,
-                                    'time_format': time_key,
-                                    'secret': secret,
-                                    'salt_format': salt_format,
-                                    'input': test_input,
-                                    'hash_type': 'md5',
-                                    'match_type': 'partial_16'
-                                })
-                                print(f"PARTIAL MATCH! Seed {seed[:16]} starts with MD5({test_input})[:16]")
-                            
-                            elif seed.startswith(hash_sha1[:16]):
-                                found_patterns.append({
-                                    'index': i,
-                                    'seed': seed,
-                                    'time_format': time_key,
-                                    'secret': secret,
-                                    'salt_format': salt_format,
-                                    'input': test_input,
-                                    'hash_type': 'sha1',
-                                    'match_type': 'partial_16'
-                                })
-                                print(f"PARTIAL MATCH! Seed {seed[:16]} starts with SHA1({test_input})[:16]")
-                            
-                            elif seed.startswith(hash_sha256[:16]):
-                                found_patterns.append({
-                                    'index': i,
-                                    'seed': seed,
-                                    'time_format': time_key,
-                                    'secret': secret,
-                                    'salt_format': salt_format,
-                                    'input': test_input,
-                                    'hash_type': 'sha256',
-                                    'match_type': 'partial_16'
-                                })
-                                print(f"PARTIAL MATCH! Seed {seed[:16]} starts with SHA256({test_input})[:16]")
-        
-        # Validate patterns on remaining games
-        if found_patterns and len(self.games) > sample_size:
-            print("\nValidating patterns on remaining games...")
-            
-            # Group by pattern type
-            pattern_groups = {}
-            for pattern in found_patterns:
-                key = (pattern['time_format'], pattern['secret'], pattern['salt_format'], 
-                       pattern['hash_type'], pattern['match_type'])
-                
-                if key not in pattern_groups:
-                    pattern_groups[key] = []
-                
-                pattern_groups[key].append(pattern)
-            
-            # Test each pattern group
-            validation_results = {}
-            
-            for key, patterns in pattern_groups.items():
-                time_format, secret, salt_format, hash_type, match_type = key
-                
-                salt = salt_format.format(secret)
-                
-                matches = 0
-                total = 0
-                
-                # Test on next 100 games after the sample
-                validation_games = self.games[sample_size:sample_size+100]
-                
-                for game in validation_games:
-                    if 'timestamp' in game and 'serverSeed' in game:
-                        total += 1
-                        
-                        ts = game['timestamp']
-                        seed = game['serverSeed']
-                        dt = datetime.datetime.fromisoformat(ts)
-                        
-                        # Get time value based on format
-                        time_val = None
-                        if time_format == 'epoch':
-                            time_val = str(int(dt.timestamp()))
-                        elif time_format == 'epoch_ms':
-                            time_val = str(int(dt.timestamp() * 1000))
-                        elif time_format == 'date':
-                            time_val = dt.strftime('%Y%m%d')
-                        elif time_format == 'time':
-                            time_val = dt.strftime('%H%M%S')
-                        elif time_format == 'datetime':
-                            time_val = dt.strftime('%Y%m%d%H%M%S')
-                        elif time_format == 'year':
-                            time_val = dt.strftime('%Y')
-                        elif time_format == 'month':
-                            time_val = dt.strftime('%m')
-                        elif time_format == 'day':
-                            time_val = dt.strftime('%d')
-                        elif time_format == 'hour':
-                            time_val = dt.strftime('%H')
-                        elif time_format == 'minute':
-                            time_val = dt.strftime('%M')
-                        elif time_format == 'second':
-                            time_val = dt.strftime('%S')
-                        elif time_format == 'microsecond':
-                            time_val = str(dt.microsecond)
-                        elif time_format == 'game_id':
-                            time_val = game['gameId'] if 'gameId' in game else ''
-                        
-                        if not time_val:
-                            continue
-                        
-                        # Same pattern as found before
-                        test_input = None
-                        for pattern in patterns:
-                            if 'TimeSecret' in pattern['input']:
-                                test_input = time_val + salt
-                            elif 'SecretTime' in pattern['input']:
-                                test_input = salt + time_val
-                            elif pattern['input'] == pattern['time_format']:
-                                test_input = time_val
-                            else:
-                                test_input = salt
-                            
-                            # Generate hash
-                            hash_value = None
-                            if hash_type == 'md5':
-                                hash_value = hashlib.md5(test_input.encode()).hexdigest()
-                            elif hash_type == 'sha1':
-                                hash_value = hashlib.sha1(test_input.encode()).hexdigest()
-                            elif hash_type == 'sha256':
-                                hash_value = hashlib.sha256(test_input.encode()).hexdigest()
-                            
-                            # Check for match
-                            if match_type == 'exact' and seed == hash_value:
-                                matches += 1
-                                break
-                            elif match_type == 'partial_16' and seed.startswith(hash_value[:16]):
-                                matches += 1
-                                break
-                
-                validation_results[key] = {
-                    'matches': matches,
-                    'total': total,
-                    'success_rate': matches / total if total > 0 else 0
-                }
-            
-            # Display validation results
-            print("\nValidation results:")
-            for key, results in validation_results.items():
-                time_format, secret, salt_format, hash_type, match_type = key
-                print(f"Pattern: {time_format} + {salt_format.format(secret)} with {hash_type} ({match_type})")
-                print(f"  Success rate: {results['matches']}/{results['total']} = {results['success_rate']*100:.2f}%")
-        
-        return found_patterns
-    
-    def test_game_id_pattern(self):
-        """
-        Test if game IDs follow a predictable pattern
-        """
-        if not self.games:
-            if not self.load_data():
-                print("No data available for analysis")
-                return
-        
-        print(f"Analyzing game ID patterns in {len(self.games)} games...")
-        
-        # Extract game IDs
-        game_ids = [game['gameId'] for game in self.games if 'gameId' in game]
-        
-        # Extract components
-        components = []
-        
-        for game_id in game_ids:
-            if '-' in game_id:
-                parts = game_id.split('-')
-                if len(parts) == 2:
-                    date_part = parts[0]
-                    id_part = parts[1]
-                    
-                    components.append({
-                        'game_id': game_id,
-                        'date_part': date_part,
-                        'id_part': id_part
-                    })
-        
-        # Analyze date part pattern
-        date_patterns = {}
-        for comp in components:
-            date_part = comp['date_part']
-            
-            # Check if it's a valid date format (YYYYMMDD)
-            if len(date_part) == 8:
-                try:
-                    year = int(date_part[:4])
-                    month = int(date_part[4:6])
-                    day = int(date_part[6:8])
-                    
-                    if 2000 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31:
-                        date_patterns[date_part] = date_patterns.get(date_part, 0) + 1
-                except:
-                    pass
-        
-        # Analyze ID part pattern
-        id_patterns = {}
-        for comp in components:
-            id_part = comp['id_part']
-            
-            # Check if it's hexadecimal
-            try:
-                int(id_part, 16)
-                id_patterns['hex'] = id_patterns.get('hex', 0) + 1
-            except:
-                pass
-            
-            # Check length
-            length = len(id_part)
-            id_patterns[f'length_{length}'] = id_patterns.get(f'length_{length}', 0) + 1
-        
-        # Check for sequential patterns
-        sequential = 0
-        for i in range(1, len(components)):
-            prev_id = components[i-1]['id_part']
-            curr_id = components[i]['id_part']
-            
-            try:
-                prev_int = int(prev_id, 16)
-                curr_int = int(curr_id, 16)
-                
-                # Check if sequential or close
-                if curr_int - prev_int == 1:
-                    sequential += 1
-            except:
-                pass
-        
-        # Check if ID part changes with time
-        time_correlation = []
-        
-        for i in range(len(self.games)):
-            if 'gameId' in self.games[i] and 'timestamp' in self.games[i]:
-                game_id = self.games[i]['gameId']
-                timestamp = self.games[i]['timestamp']
-                
-                if '-' in game_id:
-                    id_part = game_id.split('-')[1]
-                    
-                    try:
-                        id_int = int(id_part, 16)
-                        time_correlation.append((timestamp, id_int))
-                    except:
-                        pass
-        
-        # Sort by timestamp
-        time_correlation.sort(key=lambda x: x[0])
-        
-        # Calculate correlation
-        if time_correlation:
-            times = [datetime.datetime.fromisoformat(tc[0]).timestamp() for tc in time_correlation]
-            ids = [tc[1] for tc in time_correlation]
-            
-            correlation, p_value = pearsonr(times, ids)
-        else:
-            correlation, p_value = 0, 1.0
-        
-        # Compile results
-        game_id_analysis = {
-            'date_patterns': date_patterns,
-            'id_patterns': id_patterns,
-            'sequential_count': sequential,
-            'time_correlation': correlation,
-            'time_correlation_p_value': p_value
-        }
-        
-        # Display results
-        print("\n=== Game ID Analysis Results ===")
-        
-        print("Date part patterns:")
-        for pattern, count in sorted(date_patterns.items(), key=lambda x: x[1], reverse=True)[:5]:
-            print(f"  - {pattern}: {count} occurrences")
-        
-        print("\nID part patterns:")
-        for pattern, count in sorted(id_patterns.items(), key=lambda x: x[1], reverse=True):
-            print(f"  - {pattern}: {count} occurrences")
-        
-        print(f"\nSequential IDs: {sequential} out of {len(components)-1}")
-        
-        print(f"Time-ID correlation: {correlation:.4f} (p-value: {p_value:.6f})")
-        
-        if p_value < 0.05:
-            print("  * Significant correlation between time and game ID!")
-        
-        return game_id_analysis
-    
-    async def run_full_analysis(self):
-        """
-        Run all analysis methods and compile results
-        """
-        results = {}
-        
-        # Analyze time patterns
-        print("\n--- Running Time Pattern Analysis ---")
-        results['time_patterns'] = self.analyze_time_patterns()
-        
-        # Analyze binary patterns
-        print("\n--- Running Binary Pattern Analysis ---")
-        results['binary_patterns'] = self.analyze_binary_patterns()
-        
-        # Brute force seed generation
-        print("\n--- Attempting to Brute Force Seed Generation ---")
-        results['brute_force'] = self.brute_force_seed_generation(sample_size=20)
-        
-        # Test game ID patterns
-        print("\n--- Analyzing Game ID Patterns ---")
-        results['game_id_patterns'] = self.test_game_id_pattern()
-        
-        # Save results
-        with open('seed_analysis_results.json', 'w') as f:
-            # Convert non-serializable objects
-            import numpy as np
-            def convert_to_serializable(obj):
-                if isinstance(obj, np.integer):
-                    return int(obj)
-                elif isinstance(obj, np.floating):
-                    return float(obj)
-                elif isinstance(obj, np.ndarray):
-                    return obj.tolist()
-                elif isinstance(obj, datetime.datetime):
-                    return obj.isoformat()
-                return obj
-            
-            json.dump(results, f, default=convert_to_serializable, indent=2)
-        
-        print("\nAnalysis complete! Results saved to seed_analysis_results.json")
-        
-        return results
-
-# Main function to run the analyzer
-async def main():
-    # You can either specify a WebSocket URL for live data collection
-    # or a path to previously collected data
-    
-    # For live data collection:
-    # analyzer = RugsTimeSeedAnalyzer(websocket_url="wss://rugs.fun/socket")
-    # await analyzer.collect_data(max_games=1000)
-    
-    # For analysis of existing data:
-    analyzer = RugsTimeSeedAnalyzer(data_path="rugs_data.jsonl")
-    await analyzer.run_full_analysis()
-
-# Run the analyzer
-if __name__ == "__main__":
-    asyncio.run(main())
-        timestamps = [game['timestamp'] for game in recent_games]
-        seeds = [game['serverSeed'] for game in recent_games]
+    async def run_quick_analysis(self):
+        """Run a quick analysis on collected data so far"""
+        if len(self.games) < 10:
+            print("Not enough games for analysis")
+            return
+        
+        # Check for time patterns in the last 50 games
+        recent_games = self.games[-50:]
         
-        # Convert timestamps to seconds since epoch
-        epoch_times = [datetime.datetime.fromisoformat(ts).timestamp() for ts in timestamps]
+        # Extract start times and seeds
+        times = []
+        seeds = []
+        
+        for game in recent_games:
+            dt = _game_time(game)
+            if dt is not None and game.get('serverSeed'):
+                times.append(dt)
+                seeds.append(game['serverSeed'])
+        
+        if len(times) < 2:
+            print("Not enough timed games for analysis")
+            return
+        
+        # Convert start times to seconds since epoch
+        epoch_times = [dt.timestamp() for dt in times]
         
         # Check for simple patterns
-        time_diffs = [epoch_times[i] - epoch_times[i-1] for i in range(1, len(epoch_times))]
-        avg_time_diff = sum(time_diffs) / len(time_diffs)
+        time_diffs = np.diff(np.asarray(epoch_times, dtype=np.float64))
+        avg_time_diff = time_diffs.mean()
         
         print(f"Average time between games: {avg_time_diff:.2f} seconds")
         
         # Check if seeds are directly related to timestamps
-        for i in range(min(10, len(recent_games))):
-            ts = timestamps[i]
+        for i in range(min(10, len(times))):
+            dt = times[i]
             seed = seeds[i]
-            dt = datetime.datetime.fromisoformat(ts)
             
             # Try various time formats
             time_formats = {
@@ -647,18 +757,18 @@ if __name__ == "__main__":
                 if seed == hash_md5 or seed == hash_sha1 or seed == hash_sha256:
                     print(f"MATCH FOUND: Seed {seed[:10]}... matches {name} with hash algorithm")
                     self.hash_candidates.append({
-                        'timestamp': ts,
+                        'timestamp': dt.isoformat(),
                         'seed': seed,
                         'time_format': name,
                         'hash_type': 'md5' if seed == hash_md5 else ('sha1' if seed == hash_sha1 else 'sha256')
                     })
                 
-                # Check for partial matches (first 16 chars)
+                # Check for partial matches (first 16 hex chars = 8 bytes)
                 elif seed.startswith(hash_md5[:16]) or seed.startswith(hash_sha1[:16]) or seed.startswith(hash_sha256[:16]):
                     hash_type = 'md5' if seed.startswith(hash_md5[:16]) else ('sha1' if seed.startswith(hash_sha1[:16]) else 'sha256')
                     print(f"PARTIAL MATCH: Seed {seed[:16]} starts with {name} hash ({hash_type})")
                     self.hash_candidates.append({
-                        'timestamp': ts,
+                        'timestamp': dt.isoformat(),
                         'seed': seed,
                         'time_format': name,
                         'hash_type': hash_type,
@@ -676,31 +786,42 @@ if __name__ == "__main__":
         
         print(f"Analyzing time patterns in {len(self.games)} games...")
         
-        # Extract timestamps and seeds
-        timestamps = []
-        seeds = []
-        game_ids = []
-        
-        for game in self.games:
-            if 'timestamp' in game and 'serverSeed' in game:
-                timestamps.append(game['timestamp'])
-                seeds.append(game['serverSeed'])
-                game_ids.append(game['gameId'])
+        # Extract start times, seeds and game IDs of games with both a start time and a seed
+        df = self._games_frame()
+        df = df[df['time'].notna() & df['serverSeed'].notna()]
+        dts = df['time'].reset_index(drop=True)
+        offsets = df['utc_offset'].reset_index(drop=True)
+        seeds = df['serverSeed'].to_numpy()
+        game_ids = df['gameId'].to_numpy()
         
-        # Convert timestamps to datetime objects
-        dt_objects = [datetime.datetime.fromisoformat(ts) for ts in timestamps]
+        # Calendar fields come from the clock each start was recorded on, which
+        # is a legacy timestamp's own offset rather than necessarily local time
+        walls = dts.dt.tz_convert('UTC').dt.tz_localize(None) + offsets
+        dt_objects = [wall.replace(tzinfo=datetime.timezone(offset))
+                      for wall, offset in zip(walls.dt.to_pydatetime(), offsets.dt.to_pytimedelta())]
         
         # Extract time components
-        seconds = [dt.second for dt in dt_objects]
-        minutes = [dt.minute for dt in dt_objects]
-        hours = [dt.hour for dt in dt_objects]
-        microseconds = [dt.microsecond for dt in dt_objects]
+        seconds = walls.dt.second.to_numpy()
+        minutes = walls.dt.minute.to_numpy()
+        hours = walls.dt.hour.to_numpy()
+        microseconds = walls.dt.microsecond.to_numpy()
         
-        # Convert timestamps to seconds since epoch
-        epoch_times = [dt.timestamp() for dt in dt_objects]
+        # Convert start times to seconds since epoch
+        epoch_times = (dts - pd.Timestamp(0, tz='UTC')).dt.total_seconds().to_numpy()
         
         # Calculate various time deltas
-        time_diffs = [epoch_times[i] - epoch_times[i-1] for i in range(1, len(epoch_times))]
+        time_diffs = np.diff(epoch_times)
+        
+        # Format every game's time values once, a column at a time: whole seconds
+        # and milliseconds since epoch of the microsecond timestamp, truncated
+        # like int(dt.timestamp()), and the wall-clock YYYYMMDD / HHMMSS digits
+        timestamps = ((dts - pd.Timestamp(0, tz='UTC')).to_numpy() // np.timedelta64(1, 'us')) / 10**6
+        epoch_secs = np.trunc(timestamps).astype(np.int64).tolist()
+        epoch_ms = np.trunc(timestamps * 1000).astype(np.int64).tolist()
+        ymd = (walls.dt.year * 10000 + walls.dt.month * 100 + walls.dt.day).to_numpy()
+        hms = hours * 10000 + minutes * 100 + seconds
+        dates = [str(d) for d in ymd.tolist()]
+        clock_times = [f'{t:06d}' for t in hms.tolist()]
         
         # Extract game IDs and check for patterns
         game_id_patterns = []
@@ -715,115 +836,129 @@ if __name__ == "__main__":
                     # Check if date part matches timestamp
                     if len(date_part) == 8:  # YYYYMMDD format
                         game_date = date_part
-                        timestamp_date = dt_objects[i].strftime('%Y%m%d')
+                        timestamp_date = dates[i]
                         
                         if game_date == timestamp_date:
                             game_id_patterns.append({
                                 'game_id': game_id,
                                 'date_match': True,
                                 'date_part': date_part,
-                                'timestamp': timestamps[i]
+                                'timestamp': dt_objects[i].isoformat()
                             })
         
-        # Check if seeds are hashes of timestamps
+        # Check if seeds are hashes of timestamps, comparing raw digest bytes
+        # against the decoded seeds (16 hex chars = 8 bytes)
         seed_time_patterns = []
         
-        for i in range(len(seeds)):
-            seed = seeds[i]
-            dt = dt_objects[i]
-            
-            # Try various time formats
-            time_formats = {
-                'epoch': str(int(dt.timestamp())),
-                'epoch_ms': str(int(dt.timestamp() * 1000)),
-                'date': dt.strftime('%Y%m%d'),
-                'time': dt.strftime('%H%M%S'),
-                'datetime': dt.strftime('%Y%m%d%H%M%S'),
-                'game_id': game_ids[i]
+        # Seeds may repeat, so decode and unpack each distinct seed only once
+        unique_seeds, inverse, seed_counts = _unique_seeds(seeds)
+        unique_b = []
+        for seed in unique_seeds:
+            try:
+                unique_b.append(bytes.fromhex(seed))
+            except ValueError:
+                unique_b.append(b'')  # Not hex, so it can't match any hash
+        seeds_b = [unique_b[j] for j in inverse]
+        
+        # Try various time formats: encode every (game, format) string, row by row
+        format_names = ('epoch', 'epoch_ms', 'date', 'time', 'datetime', 'game_id')
+        time_inputs = []
+        for row in zip(epoch_secs, epoch_ms, dates, clock_times, game_ids):
+            epoch_sec, epoch_msec, date, clock_time, game_id = row
+            time_inputs += [
+                str(epoch_sec).encode(),           # epoch
+                str(epoch_msec).encode(),          # epoch_ms
+                date.encode(),                     # date
+                clock_time.encode(),               # time
+                (date + clock_time).encode(),      # datetime
+                game_id.encode(),                  # game_id
+            ]
+        
+        # Hash them all in one batch per algorithm, across worker processes when large
+        digests = _hash_batches(time_inputs, before_fork=self.wait_for_plots)
+        
+        # Compare every digest's first 8 bytes with its game's seed at once, as
+        # uint64s, into a (games, formats, algorithms) hit array
+        n_formats = len(format_names)
+        valid = np.array([len(seed_b) >= 8 for seed_b in seeds_b], dtype=bool)
+        seed_prefixes = np.frombuffer(b''.join(seed_b[:8].ljust(8, b'\0') for seed_b in seeds_b), dtype=np.uint64)
+        hits = np.stack([
+            np.frombuffer(b''.join(digest[:8] for digest in algo_digests), dtype=np.uint64).reshape(-1, n_formats)
+            == seed_prefixes[:, None]
+            for algo_digests in digests.values()
+        ], axis=2)
+        hits &= valid[:, None, None]
+        
+        # Check for matches or partial matches, one per matching format: a full
+        # match on any algorithm wins, otherwise the first algorithm sharing
+        # the seed's prefix
+        hash_types = list(digests)
+        for i in np.flatnonzero(hits.any(axis=(1, 2))):
+            for f in np.flatnonzero(hits[i].any(axis=1)):
+                candidates = [hash_types[a] for a in np.flatnonzero(hits[i, f])]
+                full = [hash_type for hash_type in candidates
+                        if digests[hash_type][i * n_formats + f] == seeds_b[i]]
+                seed_time_patterns.append({
+                    'seed': seeds[i],
+                    'timestamp': dt_objects[i].isoformat(),
+                    'time_format': format_names[f],
+                    'hash_type': full[0] if full else candidates[0],
+                    'match_type': 'full' if full else 'partial'
+                })
+        
+        # Check for patterns in specific bits of the seeds, unpacked into a
+        # (distinct seeds, bits) 0/1 matrix; each row counts once per occurrence
+        bits = _seeds_to_bits(unique_seeds)[:, :256]
+        
+        # Analyze each bit position, counting the ones in every column at once
+        ones = seed_counts @ bits
+        zeros = len(seeds) - ones
+        
+        # Chi-square test for uniformity, all 256 positions in one call, one row
+        # per position (the default expected counts are each row's mean, N/2)
+        observed = np.column_stack([zeros, ones])
+        chi2_stats, p_values = chisquare(observed, axis=1)
+        
+        # Store results if significant
+        bit_patterns = {}
+        for bit_pos in np.flatnonzero(p_values < 0.05):
+            bit_patterns[int(bit_pos)] = {
+                'zeros': int(zeros[bit_pos]),
+                'ones': int(ones[bit_pos]),
+                'chi2': chi2_stats[bit_pos],
+                'p_value': p_values[bit_pos]
             }
-            
-            for name, time_str in time_formats.items():
-                # Try different hash algorithms
-                hash_md5 = hashlib.md5(time_str.encode()).hexdigest()
-                hash_sha1 = hashlib.sha1(time_str.encode()).hexdigest()
-                hash_sha256 = hashlib.sha256(time_str.encode()).hexdigest()
-                
-                # Check for matches or partial matches
-                if seed == hash_md5 or seed == hash_sha1 or seed == hash_sha256:
-                    hash_type = 'md5' if seed == hash_md5 else ('sha1' if seed == hash_sha1 else 'sha256')
-                    seed_time_patterns.append({
-                        'seed': seed,
-                        'timestamp': timestamps[i],
-                        'time_format': name,
-                        'hash_type': hash_type,
-                        'match_type': 'full'
-                    })
-                elif seed.startswith(hash_md5[:16]) or seed.startswith(hash_sha1[:16]) or seed.startswith(hash_sha256[:16]):
-                    hash_type = 'md5' if seed.startswith(hash_md5[:16]) else ('sha1' if seed.startswith(hash_sha1[:16]) else 'sha256')
-                    seed_time_patterns.append({
-                        'seed': seed,
-                        'timestamp': timestamps[i],
-                        'time_format': name,
-                        'hash_type': hash_type,
-                        'match_type': 'partial'
-                    })
-        
-        # Check for patterns in specific bits of the seeds
-        binary_seeds = []
-        for seed in seeds:
-            binary = bin(int(seed, 16))[2:].zfill(len(seed) * 4)
-            binary_seeds.append(binary)
         
-        # Analyze each bit position
-        bit_patterns = {}
-        for bit_pos in range(min(256, len(binary_seeds[0]))):
-            bit_values = [int(binary[bit_pos]) for binary in binary_seeds]
+        # Analyze sequences of bits
+        sequence_patterns = {}
+        for seq_len in [2, 3, 4]:
+            n_codes = 2 ** seq_len
+            n_offsets = bits.shape[1] - seq_len
             
-            # Count occurrences of 0 and 1
-            zeros = bit_values.count(0)
-            ones = bit_values.count(1)
+            # Each seed's seq_len-bit window at every offset, read as an integer
+            # (first bit most significant), then one histogram row per offset
+            windows = sliding_window_view(bits, seq_len, axis=1)[:, :n_offsets]
+            codes = windows @ (1 << np.arange(seq_len - 1, -1, -1))
+            codes += np.arange(n_offsets) * n_codes
+            weights = np.broadcast_to(seed_counts[:, None], codes.shape).ravel()
+            counts = np.bincount(codes.ravel(), weights=weights, minlength=n_offsets * n_codes)
+            counts = counts.astype(np.int64).reshape(n_offsets, n_codes)
             
-            # Chi-square test for uniformity
-            observed = [zeros, ones]
-            expected = [len(bit_values) / 2, len(bit_values) / 2]
-            chi2_stat, p_value = chisquare(observed, expected)
+            # Check if distribution is uniform (expected N / 2**seq_len of each
+            # sequence, the row mean), in one call for every offset where all
+            # sequences occur (offsets missing a sequence are left untested)
+            tested = np.flatnonzero((counts > 0).all(axis=1))
+            chi2_stats, p_values = chisquare(counts[tested], axis=1)
             
             # Store results if significant
-            if p_value < 0.05:
-                bit_patterns[bit_pos] = {
-                    'zeros': zeros,
-                    'ones': ones,
-                    'chi2': chi2_stat,
-                    'p_value': p_value
-                }
-        
-        # Analyze sequences of bits
-        sequence_patterns = {}
-        for seq_len in [2, 3, 4]:
-            for i in range(min(256 - seq_len, len(binary_seeds[0]) - seq_len)):
-                sequences = {}
-                
-                for binary in binary_seeds:
-                    seq = binary[i:i+seq_len]
-                    sequences[seq] = sequences.get(seq, 0) + 1
-                
-                # Check if distribution is uniform
-                observed = list(sequences.values())
-                expected = [len(binary_seeds) / (2 ** seq_len)] * len(observed)
-                
-                try:
-                    chi2_stat, p_value = chisquare(observed, expected)
-                    
-                    # Store results if significant
-                    if p_value < 0.05:
-                        sequence_patterns[f"{i}:{i+seq_len}"] = {
-                            'sequences': sequences,
-                            'chi2': chi2_stat,
-                            'p_value': p_value
-                        }
-                except:
-                    # Skip if chi-square test fails (e.g., not enough data)
-                    pass
+            for i, chi2_stat, p_value in zip(tested, chi2_stats, p_values):
+                if p_value < 0.05:
+                    sequence_patterns[f"{i}:{i+seq_len}"] = {
+                        'sequences': {format(code, f'0{seq_len}b'): int(count)
+                                      for code, count in enumerate(counts[i])},
+                        'chi2': chi2_stat,
+                        'p_value': p_value
+                    }
         
         # Store results
         self.time_patterns['game_id_patterns'] = game_id_patterns
@@ -845,26 +980,10 @@ if __name__ == "__main__":
             for pattern in seed_time_patterns[:10]:  # Show first 10
                 print(f"  - {pattern['match_type']} match: {pattern['time_format']} with {pattern['hash_type']}")
         
-        # Visualize time differences
-        plt.figure(figsize=(12, 6))
-        plt.hist(time_diffs, bins=50, alpha=0.7)
-        plt.title('Distribution of Time Between Games')
-        plt.xlabel('Time (seconds)')
-        plt.ylabel('Frequency')
-        plt.savefig('time_differences.png')
-        
-        # Visualize bit patterns
-        if bit_patterns:
-            plt.figure(figsize=(12, 6))
-            bit_positions = list(bit_patterns.keys())
-            p_values = [bit_patterns[pos]['p_value'] for pos in bit_positions]
-            plt.bar(bit_positions, -np.log10(p_values), alpha=0.7)
-            plt.axhline(-np.log10(0.05), color='r', linestyle='--', label='p=0.05')
-            plt.title('Significance of Bit Position Patterns (-log10 p-value)')
-            plt.xlabel('Bit Position')
-            plt.ylabel('-log10(p-value)')
-            plt.legend()
-            plt.savefig('bit_patterns.png')
+        # Visualize time differences and bit patterns in the background
+        bit_positions = list(bit_patterns.keys())
+        p_values = [bit_patterns[pos]['p_value'] for pos in bit_positions]
+        self._submit_plot(_plot_time_patterns, time_diffs, bit_positions, p_values)
         
         return self.time_patterns
     
@@ -880,125 +999,66 @@ if __name__ == "__main__":
         print(f"Analyzing binary patterns in {len(self.games)} seeds...")
         
         # Extract seeds
-        seeds = [game['serverSeed'] for game in self.games if 'serverSeed' in game]
-        
-        # Convert to binary
-        binary_seeds = []
-        for seed in seeds:
-            binary = bin(int(seed, 16))[2:].zfill(len(seed) * 4)
-            binary_seeds.append(binary)
-        
-        # Analyze entropy of each seed
-        entropies = []
-        for binary in binary_seeds:
-            # Count 1s and 0s
-            ones = binary.count('1')
-            zeros = binary.count('0')
-            total = len(binary)
-            
-            # Calculate entropy
-            p_one = ones / total
-            p_zero = zeros / total
-            
-            import math
-            entropy = 0
-            if p_one > 0:
-                entropy -= p_one * math.log2(p_one)
-            if p_zero > 0:
-                entropy -= p_zero * math.log2(p_zero)
-            
-            entropies.append(entropy)
-        
-        # Create visual representation of binary seeds
-        plt.figure(figsize=(12, 8))
-        
-        # Create a binary heatmap (limited to first 100 seeds, 256 bits each)
-        max_seeds = min(100, len(binary_seeds))
-        max_bits = min(256, len(binary_seeds[0]))
+        seeds = self._games_frame()['serverSeed'].dropna().to_numpy()
         
-        binary_matrix = np.zeros((max_seeds, max_bits))
+        # Unpack each distinct seed once into a (distinct seeds, bits) 0/1
+        # matrix; per-seed results are mapped back to every occurrence
+        unique_seeds, inverse, _ = _unique_seeds(seeds)
+        bits = _seeds_to_bits(unique_seeds)
         
-        for i in range(max_seeds):
-            for j in range(max_bits):
-                binary_matrix[i, j] = int(binary_seeds[i][j])
+        # Analyze entropy of each seed from its share of 1 bits
+        p_one = bits.sum(axis=1, dtype=np.int32) / bits.shape[1]
+        p_zero = 1 - p_one
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entropies = -(np.where(p_one > 0, p_one * np.log2(p_one), 0.0) +
+                          np.where(p_zero > 0, p_zero * np.log2(p_zero), 0.0))
+        entropies = entropies[inverse].tolist()
         
-        # Create custom colormap (white for 0, black for 1)
-        cmap = LinearSegmentedColormap.from_list('binary', ['white', 'black'])
+        # Create a binary heatmap (limited to first 100 seeds, 256 bits each)
+        max_seeds = min(100, len(seeds))
+        max_bits = min(256, bits.shape[1])
         
-        plt.imshow(binary_matrix, cmap=cmap, aspect='auto')
-        plt.title('Binary Representation of Server Seeds')
-        plt.xlabel('Bit Position')
-        plt.ylabel('Seed Index')
-        plt.colorbar(ticks=[0, 1], label='Bit Value')
-        plt.savefig('binary_heatmap.png')
+        binary_matrix = bits[inverse[:max_seeds], :max_bits]
         
-        # Analyze autocorrelation in binary sequences
-        autocorr_results = {}
+        # Analyze autocorrelation in binary sequences: each seed's mean of
+        # bits[i] * bits[i + lag], for lags 1-20
+        lag_corrs = _autocorr(bits, 20)[inverse]
         
-        for lag in range(1, 21):  # Test lags 1-20
-            # Calculate autocorrelation for each seed
-            lag_corrs = []
-            
-            for binary in binary_seeds:
-                binary_values = [int(bit) for bit in binary]
-                n = len(binary_values)
-                
-                # Calculate autocorrelation at specified lag
-                corr = 0
-                for i in range(n - lag):
-                    corr += binary_values[i] * binary_values[i + lag]
-                
-                corr = corr / (n - lag)
-                lag_corrs.append(corr)
-            
-            # Store average autocorrelation
-            autocorr_results[lag] = sum(lag_corrs) / len(lag_corrs)
+        # Store average autocorrelation per lag
+        autocorr_results = dict(zip(range(1, 21), lag_corrs.mean(axis=0).tolist()))
         
-        # Visualize autocorrelation
-        plt.figure(figsize=(12, 6))
+        # Visualize the seeds and their autocorrelation in the background
         lags = list(autocorr_results.keys())
         autocorrs = list(autocorr_results.values())
-        plt.bar(lags, autocorrs, alpha=0.7)
-        plt.title('Average Autocorrelation in Binary Seeds')
-        plt.xlabel('Lag')
-        plt.ylabel('Autocorrelation')
-        plt.savefig('autocorrelation.png')
-        
-        # Test for runs in binary sequences
-        run_results = {}
-        
-        for binary in binary_seeds:
-            runs = 1
-            for i in range(1, len(binary)):
-                if binary[i] != binary[i-1]:
-                    runs += 1
-            
-            run_results[runs] = run_results.get(runs, 0) + 1
+        self._submit_plot(_plot_binary_patterns, binary_matrix, lags, autocorrs)
+        
+        # Test for runs in binary sequences: one more run than bit changes per seed
+        runs = (1 + (np.diff(bits, axis=1) != 0).sum(axis=1))[inverse]
+        run_lengths, run_counts = np.unique(runs, return_counts=True)
+        run_results = dict(zip(run_lengths.tolist(), run_counts.tolist()))
         
         # Calculate expected runs distribution
-        seed_length = len(binary_seeds[0])
+        seed_length = bits.shape[1]
         expected_runs = {}
         
         for r in range(2, seed_length + 1, 2):
             # Expected number of runs of length r in a random binary sequence
-            expected = len(binary_seeds) * (seed_length - r + 3) / (2 ** r)
+            expected = len(seeds) * (seed_length - r + 3) / (2 ** r)
             expected_runs[r] = expected
         
-        # Compare observed vs expected runs
+        # Compare observed vs expected runs, binomial-testing every run count at once
+        tested_runs = [r for r in sorted(run_results.keys()) if r in expected_runs]
+        observed = np.array([run_results[r] for r in tested_runs], dtype=np.int64)
+        expected = np.array([expected_runs[r] for r in tested_runs], dtype=float)
+        p_values = _binomtest_pvalues(observed, len(seeds), expected / len(seeds))
+        
         runs_comparison = {}
-        for r in sorted(run_results.keys()):
-            if r in expected_runs:
-                observed = run_results[r]
-                expected = expected_runs[r]
-                
-                # Binomial test
-                p_value = binom_test(observed, n=len(binary_seeds), p=expected/len(binary_seeds))
-                
-                runs_comparison[r] = {
-                    'observed': observed,
-                    'expected': expected,
-                    'p_value': p_value
-                }
+        for r, obs, exp, p_value in zip(tested_runs, observed.tolist(), expected.tolist(), p_values.tolist()):
+            runs_comparison[r] = {
+                'observed': obs,
+                'expected': exp,
+                'p_value': p_value
+            }
         
         # Store results
         self.bit_patterns = {
@@ -1033,7 +1093,7 @@ if __name__ == "__main__":
         
         return self.bit_patterns
     
-    def brute_force_seed_generation(self, sample_size=10):
+    async def brute_force_seed_generation(self, sample_size=10):
         """
         Attempt to brute force the seed generation algorithm
         by trying common patterns with time components
@@ -1051,14 +1111,311 @@ if __name__ == "__main__":
         # Take a sample of seeds
         sample = self.games[:sample_size]
         
-        # Common secrets that might be used
-        common_secrets = [
-            "rugs.fun", "rugsfun", "rug", "rugpull",
-            "crypto", "game", "seed", "random",
-            "bitcoin", "ethereum", "secret", "provably-fair"
-        ]
-        
-        # Common hash salt formats
-        salt_formats = [
-            "{}", "{}_salt", "salt_{}", "{}_key", "key_{}", "{}_seed", "seed_{}"
-        ]
\ No newline at end of file
+        # Extract start times, seeds and game IDs
+        times = []
+        seeds = []
+        game_ids = []
+        
+        for game in sample:
+            dt = _game_time(game)
+            if dt is not None and 'serverSeed' in game:
+                times.append(dt)
+                seeds.append(game['serverSeed'])
+                game_ids.append(game.get('gameId', ''))
+        
+        # Secret/salt combinations don't depend on the game, so format them once
+        salts = [(secret, salt_format, salt_format.format(secret))
+                 for secret in COMMON_SECRETS for salt_format in SALT_FORMATS]
+        
+        # Collect each game's time values to try
+        jobs = []
+        
+        for i, (dt, seed, game_id) in enumerate(zip(times, seeds, game_ids)):
+            # Skip empty values
+            time_formats = _time_formats(dt, game_id)
+            time_vals = [(time_key, time_val) for time_key, time_val in time_formats.items() if time_val]
+            jobs.append((i, seed, time_vals))
+        
+        # Games are independent, so search them in parallel worker processes,
+        # once any figures still being saved are done
+        self.wait_for_plots()
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(initializer=_init_seed_search, initargs=(salts, self.hash_algos)) as pool:
+            results = await asyncio.gather(*(loop.run_in_executor(pool, _search_seed, *job) for job in jobs))
+        
+        found_patterns = [pattern for matches in results for pattern in matches]
+        for pattern in found_patterns:
+            if pattern['match_type'] == 'exact':
+                print(f"MATCH! Seed {pattern['seed'][:10]}... = {pattern['hash_type'].upper()}({pattern['input']})")
+            else:
+                print(f"PARTIAL MATCH! Seed {pattern['seed'][:16]} starts with {pattern['hash_type'].upper()}({pattern['input']})[:16]")
+        
+        # Validate patterns on remaining games
+        if found_patterns and len(self.games) > sample_size:
+            print("\nValidating patterns on remaining games...")
+            
+            # Group by pattern type
+            pattern_groups = {}
+            for pattern in found_patterns:
+                key = (pattern['time_format'], pattern['secret'], pattern['salt_format'], 
+                       pattern['hash_type'], pattern['match_type'])
+                
+                if key not in pattern_groups:
+                    pattern_groups[key] = []
+                
+                pattern_groups[key].append(pattern)
+            
+            # Test on next 100 games after the sample, formatting and encoding each
+            # game's time values and decoding its seed once for all pattern groups
+            validation_games = []
+            for game in self.games[sample_size:sample_size+100]:
+                dt = _game_time(game)
+                if dt is None or 'serverSeed' not in game:
+                    continue
+                try:
+                    seed_bytes = bytes.fromhex(game['serverSeed'])
+                except ValueError:
+                    seed_bytes = b''  # Not hex, so it can't match any hash
+                time_formats = {time_key: time_val.encode()
+                                for time_key, time_val in _time_formats(dt, game.get('gameId', '')).items()}
+                validation_games.append((seed_bytes, time_formats))
+            
+            # Test each pattern group
+            validation_results = {}
+            
+            for key, patterns in pattern_groups.items():
+                time_format, secret, salt_format, hash_type, match_type = key
+                
+                salt_bytes = _salt(secret, salt_format)
+                hash_ctor = HASH_CTORS[hash_type]
+                salt_primed = _primed(hash_type, salt_bytes)
+                salt_digest = salt_primed.digest()
+                
+                # Inputs the group's patterns hashed (repeats add nothing, as
+                # the first match ends a game's check)
+                input_kinds = list(dict.fromkeys(pattern['kind'] for pattern in patterns))
+                
+                matches = 0
+                total = len(validation_games)
+                
+                for seed_bytes, time_formats in validation_games:
+                    time_val = time_formats[time_format]
+                    
+                    if not time_val or len(seed_bytes) < 8:
+                        continue
+                    
+                    # Same pattern as found before
+                    for input_kind in input_kinds:
+                        if input_kind == 'TimeSecret':
+                            digest = hash_ctor(time_val + salt_bytes).digest()
+                        elif input_kind == 'SecretTime':
+                            hasher = salt_primed.copy()
+                            hasher.update(time_val)
+                            digest = hasher.digest()
+                        elif input_kind == 'Time':
+                            digest = hash_ctor(time_val).digest()
+                        else:
+                            digest = salt_digest
+                        
+                        # Check for match (16 hex chars = 8 bytes)
+                        if match_type == 'exact' and seed_bytes == digest:
+                            matches += 1
+                            break
+                        elif match_type == 'partial_16' and seed_bytes[:8] == digest[:8]:
+                            matches += 1
+                            break
+                
+                # Chance (at most) that a random seed matches one of the group's
+                # hashes in full or in its first 16 hex chars
+                hex_len = 16 if match_type == 'partial_16' else 2 * HASH_CTORS[hash_type]().digest_size
+                p_match = len(input_kinds) * 16.0 ** -hex_len
+                p_value = binomtest(matches, total, p=p_match, alternative='greater').pvalue if total > 0 else 1.0
+                
+                validation_results[key] = {
+                    'matches': matches,
+                    'total': total,
+                    'success_rate': matches / total if total > 0 else 0,
+                    'p_value': p_value
+                }
+            
+            # Every pattern group is a separate test, so control the false
+            # discovery rate across them (Benjamini-Hochberg)
+            q_values = false_discovery_control([results['p_value'] for results in validation_results.values()], method='bh')
+            for results, q_value in zip(validation_results.values(), q_values):
+                results['q_value'] = float(q_value)
+            
+            # Display validation results
+            print("\nValidation results:")
+            for key, results in validation_results.items():
+                time_format, secret, salt_format, hash_type, match_type = key
+                print(f"Pattern: {time_format} + {salt_format.format(secret)} with {hash_type} ({match_type})")
+                print(f"  Success rate: {results['matches']}/{results['total']} = {results['success_rate']*100:.2f}%")
+                print(f"  p-value: {results['p_value']:.3g} (BH-adjusted: {results['q_value']:.3g})")
+        
+        # Drop cached salts and primed contexts so repeat runs don't accumulate them
+        _salt.cache_clear()
+        _primed.cache_clear()
+        
+        return found_patterns
+    
+    def test_game_id_pattern(self):
+        """
+        Test if game IDs follow a predictable pattern
+        """
+        if not self.games:
+            if not self.load_data():
+                print("No data available for analysis")
+                return
+        
+        print(f"Analyzing game ID patterns in {len(self.games)} games...")
+        
+        # Extract game IDs
+        df = self._games_frame()
+        game_ids = df['gameId'].dropna().to_numpy()
+        
+        # Extract components
+        components = []
+        
+        for game_id in game_ids:
+            if '-' in game_id:
+                parts = game_id.split('-')
+                if len(parts) == 2:
+                    date_part = parts[0]
+                    id_part = parts[1]
+                    
+                    components.append({
+                        'game_id': game_id,
+                        'date_part': date_part,
+                        'id_part': id_part
+                    })
+        
+        # Parse every ID part once, keyed by game ID
+        id_ints_by_game = {}
+        for game_id in game_ids:
+            if '-' in game_id:
+                id_int = _hex_int(game_id.split('-')[1])
+                if id_int is not None:
+                    id_ints_by_game[game_id] = id_int
+        
+        # Analyze date part pattern (YYYYMMDD)
+        date_patterns = Counter(comp['date_part'] for comp in components if _valid_ymd(comp['date_part']))
+        
+        # Analyze ID part pattern: hexadecimal and length
+        comp_ints = [id_ints_by_game.get(comp['game_id']) for comp in components]
+        hex_count = sum(id_int is not None for id_int in comp_ints)
+        id_patterns = Counter({'hex': hex_count} if hex_count else {})
+        id_patterns.update(f"length_{len(comp['id_part'])}" for comp in components)
+        
+        # Check for sequential patterns; only adjacent pairs that both parse count
+        is_hex = np.fromiter((id_int is not None for id_int in comp_ints), dtype=bool, count=len(comp_ints))
+        wide = any(id_int is not None and id_int.bit_length() > 63 for id_int in comp_ints)
+        id_ints = np.array([id_int or 0 for id_int in comp_ints], dtype=object if wide else np.int64)
+        sequential = int(np.sum((np.diff(id_ints) == 1) & is_hex[1:] & is_hex[:-1]))
+        
+        # Check if ID part changes with time
+        id_times = df[['gameId', 'time']].dropna()
+        epoch_times = (id_times['time'] - pd.Timestamp(0, tz='UTC')).dt.total_seconds().to_numpy()
+        time_correlation = [(epoch_time, id_ints_by_game[game_id])
+                            for game_id, epoch_time in zip(id_times['gameId'].to_numpy(), epoch_times)
+                            if game_id in id_ints_by_game]
+        
+        # Calculate correlation
+        if len(time_correlation) > 2:
+            times = [tc[0] for tc in time_correlation]
+            ids = [tc[1] for tc in time_correlation]
+            
+            correlation, p_value = _pearson(times, ids)
+        else:
+            correlation, p_value = 0, 1.0
+        
+        # Compile results
+        game_id_analysis = {
+            'date_patterns': date_patterns,
+            'id_patterns': id_patterns,
+            'sequential_count': sequential,
+            'time_correlation': correlation,
+            'time_correlation_p_value': p_value
+        }
+        
+        # Display results
+        print("\n=== Game ID Analysis Results ===")
+        
+        print("Date part patterns:")
+        for pattern, count in sorted(date_patterns.items(), key=lambda x: x[1], reverse=True)[:5]:
+            print(f"  - {pattern}: {count} occurrences")
+        
+        print("\nID part patterns:")
+        for pattern, count in sorted(id_patterns.items(), key=lambda x: x[1], reverse=True):
+            print(f"  - {pattern}: {count} occurrences")
+        
+        print(f"\nSequential IDs: {sequential} out of {len(components)-1}")
+        
+        print(f"Time-ID correlation: {correlation:.4f} (p-value: {p_value:.6f})")
+        
+        if p_value < 0.05:
+            print("  * Significant correlation between time and game ID!")
+        
+        return game_id_analysis
+    
+    async def run_full_analysis(self):
+        """
+        Run all analysis methods and compile results
+        """
+        results = {}
+        
+        # Analyze time patterns
+        print("\n--- Running Time Pattern Analysis ---")
+        results['time_patterns'] = self.analyze_time_patterns()
+        
+        # Analyze binary patterns
+        print("\n--- Running Binary Pattern Analysis ---")
+        results['binary_patterns'] = self.analyze_binary_patterns()
+        
+        # Let the figures finish before the brute force forks its worker processes
+        self.wait_for_plots()
+        
+        # Brute force seed generation
+        print("\n--- Attempting to Brute Force Seed Generation ---")
+        results['brute_force'] = await self.brute_force_seed_generation(sample_size=20)
+        
+        # Test game ID patterns
+        print("\n--- Analyzing Game ID Patterns ---")
+        results['game_id_patterns'] = self.test_game_id_pattern()
+        
+        # Save results
+        with open('seed_analysis_results.json', 'wb') as f:
+            f.write(_json_dumps_results(results))
+        
+        print("\nAnalysis complete! Results saved to seed_analysis_results.json")
+        
+        return results
+
+# Main function to run the analyzer
+async def main():
+    parser = argparse.ArgumentParser(description='Rugs.fun time-based seed analysis')
+    parser.add_argument('--include-sha1', action='store_true', help='Also try SHA-1 in the seed brute force')
+    
+    args = parser.parse_args()
+    hash_algos = HASH_ALGOS_WITH_SHA1 if args.include_sha1 else HASH_ALGOS
+    
+    # hashlib is backed by OpenSSL, which uses the CPU's SHA extensions
+    # (SHA-NI / ARMv8 SHA2) when it was built with them
+    print(f"Hashing with {ssl.OPENSSL_VERSION}")
+    
+    # You can either specify a WebSocket URL for live data collection
+    # or a path to previously collected data
+    
+    # For live data collection:
+    # analyzer = RugsTimeSeedAnalyzer(websocket_url="wss://rugs.fun/socket", hash_algos=hash_algos)
+    # await analyzer.collect_data(max_games=1000)
+    
+    # For analysis of existing data:
+    analyzer = RugsTimeSeedAnalyzer(data_path="rugs_data.jsonl", hash_algos=hash_algos)
+    await analyzer.run_full_analysis()
+
+# Run the analyzer
+if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())